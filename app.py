@@ -4,13 +4,27 @@ DocketVoice Integrated Platform - WebRTC + Production System
 Complete bankruptcy consultation with voice interface generation
 """
 
-from flask import Flask, render_template, request, jsonify, send_from_directory
+from flask import Flask, Response, render_template, request, jsonify, stream_with_context
+from flask.json.provider import DefaultJSONProvider
+from flask.sessions import SessionInterface
 import asyncio
+import functools
+import hashlib
 import json
 import logging
 import os
+import secrets
+import shutil
+import threading
 import time
+import httpx
+from collections import deque
+from uuid import uuid4
+from jinja2 import FileSystemBytecodeCache
+from werkzeug.middleware.proxy_fix import ProxyFix
+from werkzeug.utils import secure_filename
 from pathlib import Path
+from typing import Any, Dict, Optional
 from config import Settings
 from sota_voice import ModernRealtimeVoiceSystem, SOTA_Voice
 from sota_agent_production import SOTABankruptcyAgentProduction
@@ -18,42 +32,194 @@ from sota_ai import SOTA_AI
 from sota_document_processor import SOTADocumentProcessor
 from sota_forms_complete import CompleteBankruptcyCase
 
+# Fast JSON parsing
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Fast non-cryptographic hashing for case IDs
+try:
+    import xxhash
+    XXHASH_AVAILABLE = True
+except ImportError:
+    XXHASH_AVAILABLE = False
+
+# Compiled JSON Schema validation for tool-call arguments
+try:
+    import fastjsonschema
+    FASTJSONSCHEMA_AVAILABLE = True
+except ImportError:
+    FASTJSONSCHEMA_AVAILABLE = False
+
+try:
+    import jsonschema
+    JSONSCHEMA_AVAILABLE = True
+except ImportError:
+    JSONSCHEMA_AVAILABLE = False
+
+# Response compression
+try:
+    from flask_compress import Compress
+    COMPRESS_AVAILABLE = True
+except ImportError:
+    COMPRESS_AVAILABLE = False
+
 # Setup logging
-logging.basicConfig(level=logging.INFO)
+# Same variable as MonitoringConfig.log_level; set WARNING in production to skip INFO chatter
+logging.basicConfig(level=os.environ.get("MONITORING_LOG_LEVEL", "INFO").upper())
 logger = logging.getLogger(__name__)
 
+class OrjsonProvider(DefaultJSONProvider):
+    """Flask JSON provider backed by orjson; unsupported types use Flask's default hook"""
+    
+    option = orjson.OPT_NON_STR_KEYS if ORJSON_AVAILABLE else 0
+    
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, default=self.default, option=self.option).decode()
+    
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+    
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        body = orjson.dumps(obj, default=self.default, option=self.option)
+        return self._app.response_class(body, mimetype=self.mimetype)
+
+class NullSessionInterface(SessionInterface):
+    """No cookie sessions: the app keeps no per-user state in Flask's session"""
+    
+    def open_session(self, app, request):
+        return self.make_null_session(app)
+    
+    def save_session(self, app, session, response):
+        return None
+
 # Initialize Flask app
 app = Flask(__name__)
-app.config['SECRET_KEY'] = 'docketvoice_secret_key_2024'
+if ORJSON_AVAILABLE:
+    app.json = OrjsonProvider(app)
+app.json.sort_keys = False  # Key order is irrelevant to clients; skip sorting on every response
+app.config['SECRET_KEY'] = os.environ.get("FLASK_SECRET_KEY") or secrets.token_bytes(32)
+app.session_interface = NullSessionInterface()
+
+# Reverse proxies in front of gunicorn; request.remote_addr is then the client address
+# from X-Forwarded-For. Set 0 when clients connect to gunicorn directly.
+TRUSTED_PROXY_COUNT = int(os.environ.get("TRUSTED_PROXY_COUNT", 1))
+if TRUSTED_PROXY_COUNT:
+    app.wsgi_app = ProxyFix(app.wsgi_app, x_for=TRUSTED_PROXY_COUNT, x_proto=TRUSTED_PROXY_COUNT)
+
+# Compile templates once: no per-request mtime checks, bytecode reused across restarts
+app.config['TEMPLATES_AUTO_RELOAD'] = False
+JINJA_CACHE_DIR = Path(".jinja_cache")
+JINJA_CACHE_DIR.mkdir(exist_ok=True)
+app.jinja_env.bytecode_cache = FileSystemBytecodeCache(directory=str(JINJA_CACHE_DIR), pattern="%s.cache")
+STATIC_MAX_AGE = 31536000  # One year
+app.config['SEND_FILE_MAX_AGE_DEFAULT'] = STATIC_MAX_AGE
+
+# Compress JSON responses; streamed NDJSON is left alone so progress lines are not held in the compressor
+app.config['COMPRESS_ALGORITHM'] = ['br', 'gzip']
+app.config['COMPRESS_MIN_SIZE'] = 512
+app.config['COMPRESS_LEVEL'] = 5
+app.config['COMPRESS_MIMETYPES'] = [
+    'text/html', 'text/css', 'text/javascript', 'application/javascript',
+    'application/json', 'application/sdp'
+]
+app.config['COMPRESS_STREAMS'] = False
+if COMPRESS_AVAILABLE:
+    Compress(app)
+
+@functools.lru_cache(maxsize=None)
+def _static_error_body(message: str, status: Optional[str] = None) -> bytes:
+    """JSON body for a fixed error reply, serialized once per message"""
+    payload = {"success": False, "status": status, "error": message} if status else {"success": False, "error": message}
+    return app.json.response(payload).get_data()
+
+def static_error(message: str, code: int = 200, status: Optional[str] = None) -> Response:
+    """Fresh response for a fixed error message over its shared, prebuilt body"""
+    return app.response_class(_static_error_body(message, status), status=code, mimetype=app.json.mimetype)
+# Short filler lines spoken while slow tool calls run, so the client never hears dead air
+PHATIC_LINES = ["One moment while I check that.", "Let me pull that together for you."]
+PHATIC_FUNCTIONS = ["perform_means_test_analysis", "generate_bankruptcy_documents"]
+
+# Pooled HTTP/2 client for OpenAI SDP forwarding (reuses TLS connections across sessions)
+OPENAI_REALTIME_URL = "https://api.openai.com/v1/realtime"  # <-- note: NOT /calls
+_openai_client = httpx.Client(
+    http2=True,
+    timeout=30.0,
+    limits=httpx.Limits(max_keepalive_connections=32)
+)
+
+def _preconnect_openai():
+    """Open a pooled TLS connection to the Realtime host; the response status is irrelevant"""
+    try:
+        _openai_client.head(OPENAI_REALTIME_URL, timeout=5.0)
+    except httpx.HTTPError as e:
+        logger.debug(f"OpenAI preconnect failed: {e}")
+
+BASE36_DIGITS = "0123456789abcdefghijklmnopqrstuvwxyz"
+
+def _base36(number: int) -> str:
+    """Encode a non-negative integer in base 36"""
+    digits = []
+    while True:
+        number, remainder = divmod(number, 36)
+        digits.append(BASE36_DIGITS[remainder])
+        if not number:
+            return "".join(reversed(digits))
+
+def _new_case_id() -> str:
+    """Compact case ID, unique per process even for sessions started in the same second"""
+    seed = f"{os.getpid()}:{time.monotonic_ns()}".encode()
+    if XXHASH_AVAILABLE:
+        digest = xxhash.xxh3_64_intdigest(seed)
+    else:
+        digest = int.from_bytes(hashlib.blake2b(seed, digest_size=8).digest(), "big")
+    return f"case_{_base36(digest)}"
+
+# Working directories, created once at import
+GENERATED_DIR = Path("generated_documents")
+UPLOAD_DIR = Path("uploaded_documents")
+CASE_FILES_DIR = Path("case_files")
+UPLOAD_JOBS_DIR = Path("upload_jobs")
+# Partial uploads land here, beside UPLOAD_DIR, so scans of UPLOAD_DIR only see whole files
+UPLOAD_STAGING_DIR = Path("upload_staging")
+for _directory in (GENERATED_DIR, UPLOAD_DIR, CASE_FILES_DIR, UPLOAD_JOBS_DIR, UPLOAD_STAGING_DIR):
+    _directory.mkdir(exist_ok=True)
 
 # Global system instances
 voice_system = None
+webrtc_config = None
 production_agent = None
 ai_provider = None
-settings = None
 current_case = None
 
+# Settings are read once at import; preforked workers inherit them
+try:
+    settings = Settings()
+    logger.info("Settings loaded")
+except Exception as e:
+    logger.error(f"Failed to load settings: {e}")
+    settings = None
+
 async def initialize_production_platform():
     """Initialize the complete production platform"""
-    global voice_system, production_agent, ai_provider, settings, current_case
+    global voice_system, webrtc_config, production_agent, ai_provider, current_case
     
     try:
-        # Load settings
-        settings = Settings()
-        logger.info("Settings loaded")
+        if settings is None:
+            raise RuntimeError("Settings not loaded")
         
-        # Initialize AI provider
+        # Initialize AI and voice providers concurrently
         ai_provider = SOTA_AI(settings)
-        await ai_provider.initialize()
-        logger.info("AI provider initialized")
-        
-        # Initialize voice providers
         voice_provider = SOTA_Voice(settings)
-        await voice_provider.initialize()
-        logger.info("Voice provider initialized")
+        await asyncio.gather(ai_provider.initialize(), voice_provider.initialize())
+        logger.info("AI and voice providers initialized")
         
         # Initialize WebRTC voice system
         voice_system = ModernRealtimeVoiceSystem(settings)
+        webrtc_config = voice_system.get_webrtc_config()  # Static ICE settings, served as-is
         logger.info("WebRTC voice system initialized")
         
         # Initialize production agent with full capabilities
@@ -62,15 +228,10 @@ async def initialize_production_platform():
         )
         logger.info("Production bankruptcy agent initialized")
         
-        # Initialize current case
-        current_case = CompleteBankruptcyCase()
+        # Initialize current case - function calls fill the agent's case
+        current_case = production_agent.bankruptcy_case
         logger.info("Bankruptcy case initialized")
         
-        # Create required directories
-        Path("generated_documents").mkdir(exist_ok=True)
-        Path("uploaded_documents").mkdir(exist_ok=True)
-        Path("case_files").mkdir(exist_ok=True)
-        
         logger.info("Production platform fully initialized")
         return True
         
@@ -78,18 +239,71 @@ async def initialize_production_platform():
         logger.error(f"Failed to initialize production platform: {e}")
         return False
 
-# Initialize the platform on startup
 import atexit
-loop = asyncio.new_event_loop()
-asyncio.set_event_loop(loop)
-init_success = loop.run_until_complete(initialize_production_platform())
+ASYNC_CALL_TIMEOUT = 300
+PLATFORM_READY_TIMEOUT = 30
+loop = None
+_loop_thread = None
+_platform_lock = threading.Lock()
+platform_ready = threading.Event()
+init_success = False
 
-if not init_success:
-    logger.error("Failed to initialize production platform")
+async def _initialize_and_signal():
+    """Run platform initialization on the platform loop and open the readiness gate"""
+    global init_success
+    init_success = await initialize_production_platform()
+    if not init_success:
+        logger.error("Failed to initialize production platform")
+    platform_ready.set()
+
+def start_platform() -> None:
+    """Start the platform loop and schedule initialization on it without blocking"""
+    global loop, _loop_thread
+    
+    with _platform_lock:
+        if loop is not None:
+            return
+        
+        # Keep the platform loop running so async clients stay warm between requests
+        loop = asyncio.new_event_loop()
+        _loop_thread = threading.Thread(target=loop.run_forever, name="platform-loop", daemon=True)
+        _loop_thread.start()
+        asyncio.run_coroutine_threadsafe(_initialize_and_signal(), loop)
+
+# Importing the app does no network or model setup. Gunicorn workers start the
+# platform in post_fork (see gunicorn_conf.py); otherwise the first request does.
+@app.before_request
+def wait_for_platform():
+    """Start the platform on first use and hold API requests until it is initialized"""
+    if loop is None:
+        start_platform()
+    if platform_ready.is_set() or not request.path.startswith('/api/'):
+        return None
+    if request.endpoint == 'health_check' or not platform_ready.wait(PLATFORM_READY_TIMEOUT):
+        return static_error("Platform is starting", 503, status="starting")
+    return None
+
+def run_async(coro, timeout: Optional[float] = ASYNC_CALL_TIMEOUT):
+    """Run a coroutine on the shared platform loop and wait for its result"""
+    return asyncio.run_coroutine_threadsafe(coro, loop).result(timeout=timeout)
+
+async def _anext_or_none(iterator):
+    """Await the next item of an async iterator, or None once it is exhausted"""
+    try:
+        return await iterator.__anext__()
+    except StopAsyncIteration:
+        return None
+
+# Settings do not change after startup, so resolve the key check once
+API_KEY_CONFIGURED = settings is not None and bool(settings.ai.openai_api_key)
 
 def cleanup():
-    if loop:
-        loop.close()
+    _openai_client.close()
+    if loop and _loop_thread:
+        loop.call_soon_threadsafe(loop.stop)
+        _loop_thread.join(timeout=5)
+        if not loop.is_running():
+            loop.close()
 
 atexit.register(cleanup)
 
@@ -165,8 +379,7 @@ def get_bankruptcy_function_definitions():
                             "full_name": {"type": "string"},
                             "ssn": {"type": "string"},
                             "date_of_birth": {"type": "string"}
-                        },
-                        "additionalProperties": True
+                        }
                     },
                     "dependents": {
                         "type": "array",
@@ -188,12 +401,10 @@ def get_bankruptcy_function_definitions():
                             "position": {"type": "string"},
                             "start_date": {"type": "string"},
                             "income_frequency": {"type": "string"}
-                        },
-                        "additionalProperties": True
+                        }
                     }
                 },
-                "required": ["full_name"],
-                "additionalProperties": True
+                "required": ["full_name"]
             }
         },
         {
@@ -250,8 +461,7 @@ def get_bankruptcy_function_definitions():
                         }
                     }
                 },
-                "required": ["monthly_income"],
-                "additionalProperties": True
+                "required": ["monthly_income"]
             }
         },
         {
@@ -281,6 +491,233 @@ def get_bankruptcy_function_definitions():
         }
     ]
 
+# Static Realtime session payloads, built once per process instead of per /api/token call
+BANKRUPTCY_INSTRUCTIONS = get_bankruptcy_consultation_instructions()
+BANKRUPTCY_TOOLS = get_bankruptcy_function_definitions()
+_session_config = None
+
+# Ephemeral token minting: a short per-session cache coalesces bursts (retries, double
+# clicks) into one upstream call, and a sliding window caps mints per client address.
+# A minted token is only ever reused for the browser session that asked for it.
+TOKEN_CACHE_TTL = 5.0
+TOKEN_CACHE_MAX_CLIENTS = 1024
+TOKEN_RATE_LIMIT = 20
+TOKEN_RATE_WINDOW = 60.0
+TOKEN_SESSION_HEADER = "X-Client-Session"
+_token_cache: Dict[str, tuple] = {}
+_token_locks: Dict[str, list] = {}  # session key -> [lock, requests currently using it]
+_token_requests: Dict[str, deque] = {}
+_token_guard = threading.Lock()
+
+def token_session_key(client: str) -> Optional[str]:
+    """Coalescing key for this request's browser session, or None if it sent no session id"""
+    session_id = request.headers.get(TOKEN_SESSION_HEADER, "")
+    if not 16 <= len(session_id) <= 64 or not session_id.isalnum():
+        return None
+    return f"{client}|{session_id}"
+
+def _prune_token_state(now: float) -> None:
+    """Drop expired cache entries and idle clients; caller holds _token_guard"""
+    for key in [k for k, (expires, _, _) in _token_cache.items() if expires <= now]:
+        del _token_cache[key]
+    for client in [c for c, hits in _token_requests.items() if not hits or now - hits[-1] > TOKEN_RATE_WINDOW]:
+        del _token_requests[client]
+    # A lock in use by any request stays, so concurrent requests keep sharing one lock
+    for key in [k for k, (_, users) in _token_locks.items() if k not in _token_cache and not users]:
+        del _token_locks[key]
+
+def token_rate_limited(client: str) -> bool:
+    """Record a token request and report whether the client is over its limit"""
+    now = time.monotonic()
+    with _token_guard:
+        if len(_token_requests) > TOKEN_CACHE_MAX_CLIENTS:
+            _prune_token_state(now)
+        hits = _token_requests.setdefault(client, deque())
+        while hits and now - hits[0] > TOKEN_RATE_WINDOW:
+            hits.popleft()
+        if len(hits) >= TOKEN_RATE_LIMIT:
+            return True
+        hits.append(now)
+        return False
+
+def mint_ephemeral_token(session_key: Optional[str]) -> tuple:
+    """Token and model for a browser session, reusing its own mint from the last few seconds"""
+    if session_key is None:
+        return voice_system.create_ephemeral_token_and_model()
+    
+    with _token_guard:
+        if len(_token_locks) > TOKEN_CACHE_MAX_CLIENTS:
+            _prune_token_state(time.monotonic())
+        entry = _token_locks.setdefault(session_key, [threading.Lock(), 0])
+        entry[1] += 1
+    
+    try:
+        # Concurrent requests from one session wait here and share the first mint
+        with entry[0]:
+            cached = _token_cache.get(session_key)
+            if cached and cached[0] > time.monotonic():
+                return cached[1], cached[2]
+            
+            token, model = voice_system.create_ephemeral_token_and_model()
+            if token and model:
+                with _token_guard:
+                    _token_cache[session_key] = (time.monotonic() + TOKEN_CACHE_TTL, token, model)
+            return token, model
+    finally:
+        with _token_guard:
+            entry[1] -= 1
+
+# Tool name -> coroutine factory on the production agent
+TOOL_HANDLERS = {
+    "collect_personal_info": lambda agent, arguments: agent._process_personal_information(arguments),
+    "collect_financial_data": lambda agent, arguments: agent._process_financial_data(arguments),
+    "perform_means_test_analysis": lambda agent, arguments: agent._perform_means_test_analysis(arguments),
+    "generate_bankruptcy_documents": lambda agent, arguments: agent._generate_all_documents()
+}
+
+def _compile_tool_validator(schema: Dict[str, Any]):
+    """Build a validator once; fastjsonschema generates code, jsonschema checks its schema up front"""
+    if FASTJSONSCHEMA_AVAILABLE:
+        return fastjsonschema.compile(schema)
+    
+    validator_class = jsonschema.validators.validator_for(schema)
+    validator_class.check_schema(schema)
+    validator = validator_class(schema)
+    
+    def validate(arguments):
+        validator.validate(arguments)
+        return arguments
+    return validate
+
+# One compiled validator per tool, each returning the validated arguments, and the error they
+# raise; jsonschema is only a fallback for installs without fastjsonschema
+if FASTJSONSCHEMA_AVAILABLE or JSONSCHEMA_AVAILABLE:
+    if FASTJSONSCHEMA_AVAILABLE:
+        ToolArgumentsError = fastjsonschema.JsonSchemaException
+    else:
+        ToolArgumentsError = jsonschema.ValidationError
+    TOOL_VALIDATORS = {
+        tool["name"]: _compile_tool_validator(tool["parameters"]) for tool in BANKRUPTCY_TOOLS
+    }
+else:
+    class ToolArgumentsError(Exception):
+        """Invalid tool-call arguments; never raised while no schema library is installed"""
+        message = ""
+    
+    logger.warning("No JSON Schema library available - tool-call arguments are not validated")
+    TOOL_VALIDATORS = {}
+
+def get_session_config() -> Dict[str, Any]:
+    """Session configuration sent with every token; cached once the voice system exists"""
+    global _session_config
+    if _session_config is None:
+        _session_config = {
+            "instructions": BANKRUPTCY_INSTRUCTIONS,
+            "tools": BANKRUPTCY_TOOLS,
+            "tool_choice": "auto",
+            "modalities": ["audio", "text"],
+            "voice": "alloy",
+            "turn_detection": voice_system.get_turn_detection_config(),
+            "input_audio_transcription": {"model": voice_system.config.transcription_model},
+            "temperature": 0.2
+        }
+    return _session_config
+
+UPLOAD_CHUNK_SIZE = 1 << 20  # 1 MiB
+
+def upload_path_for(filename: str) -> Path:
+    """Unique, traversal-safe destination for an uploaded file"""
+    name = secure_filename(filename) or "upload"
+    return UPLOAD_DIR / f"{uuid4().hex}_{name}"
+
+def save_upload(file, file_path: Path) -> None:
+    """Stream an uploaded file to a staging file in fixed-size chunks, then move it into place"""
+    tmp_path = UPLOAD_STAGING_DIR / f"{uuid4().hex}.part"
+    try:
+        with open(tmp_path, "wb", buffering=UPLOAD_CHUNK_SIZE) as out:
+            shutil.copyfileobj(file.stream, out, length=UPLOAD_CHUNK_SIZE)
+            if settings is not None and settings.documents.fsync_uploads:
+                out.flush()
+                os.fsync(out.fileno())
+        os.replace(tmp_path, file_path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+# Background document processing jobs, one JSON file per task so a status poll can be
+# answered by any worker. Only status metadata is stored; extracted data stays on the case.
+UPLOAD_JOB_TTL = 3600.0  # Jobs untouched this long are evicted; processing takes minutes at most
+
+def _upload_job_path(task_id: str) -> Optional[Path]:
+    """Job file for a task id, or None if the id is not one we issue (uuid4 hex)"""
+    if len(task_id) != 32 or not all(c in "0123456789abcdef" for c in task_id):
+        return None
+    return UPLOAD_JOBS_DIR / f"{task_id}.json"
+
+def _write_upload_job(task_id: str, job: Dict[str, Any]) -> None:
+    """Atomically replace a job's state so pollers never read a partial file"""
+    job_path = _upload_job_path(task_id)
+    tmp_path = job_path.with_name(f".{uuid4().hex}.part")
+    try:
+        tmp_path.write_bytes(dump_json_line(job))
+        os.replace(tmp_path, job_path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+def _read_upload_job(task_id: str) -> Optional[Dict[str, Any]]:
+    """Current state of a job, or None if it is unknown or already evicted"""
+    job_path = _upload_job_path(task_id)
+    if job_path is None:
+        return None
+    try:
+        data = job_path.read_bytes()
+    except FileNotFoundError:
+        return None
+    return orjson.loads(data) if ORJSON_AVAILABLE else json.loads(data)
+
+def _evict_upload_jobs() -> None:
+    """Drop job files (and abandoned temp files) older than the TTL"""
+    cutoff = time.time() - UPLOAD_JOB_TTL
+    for job_path in UPLOAD_JOBS_DIR.iterdir():
+        try:
+            if job_path.stat().st_mtime < cutoff:
+                job_path.unlink(missing_ok=True)
+        except FileNotFoundError:
+            continue
+
+def _record_upload_result(task_id: str, filename: str, future) -> None:
+    """Store the outcome of a finished document processing job"""
+    try:
+        result = future.result()
+        job = {
+            "status": "completed",
+            "filename": filename,
+            "document_type": result.document_type
+        }
+    except Exception as e:
+        logger.error(f"Error processing document {filename}: {e}")
+        job = {"status": "failed", "filename": filename, "error": str(e)}
+    try:
+        _write_upload_job(task_id, job)
+    except Exception as e:
+        logger.error(f"Could not record upload job {task_id}: {e}")
+
+def dump_json_line(payload: Dict[str, Any]) -> bytes:
+    """Serialize one newline-delimited JSON record"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(payload) + b"\n"
+    return json.dumps(payload).encode() + b"\n"
+
+def load_json_body() -> Dict[str, Any]:
+    """Parse the JSON request body, using orjson when available"""
+    body = request.get_data()
+    if not body:
+        return {}
+    if ORJSON_AVAILABLE:
+        return orjson.loads(body)
+    return json.loads(body)
+
 @app.route('/')
 def index():
     """Main web interface"""
@@ -289,21 +726,22 @@ def index():
 @app.route('/api/token', methods=['POST'])
 def get_ephemeral_token():
     """Generate ephemeral token for WebRTC connection"""
-    global voice_system
+    global voice_system, webrtc_config
     
     try:
         if not voice_system:
             logger.error("Voice system not initialized")
-            return jsonify({"success": False, "error": "Voice system not initialized"})
+            return static_error("Voice system not initialized")
+        
+        client = request.remote_addr or "unknown"
+        if token_rate_limited(client):
+            return static_error("Too many token requests", 429)
         
         # Create ephemeral token with model
-        token, model = voice_system.create_ephemeral_token_and_model()
+        token, model = mint_ephemeral_token(token_session_key(client))
         
         if not token or not model:
-            return jsonify({"success": False, "error": "Failed to create token"})
-        
-        # Get basic WebRTC config (no session config here)
-        webrtc_config = voice_system.get_webrtc_config()
+            return static_error("Failed to create token")
         
         # Return token, model, and session configuration for client-side setup
         return jsonify({
@@ -311,23 +749,8 @@ def get_ephemeral_token():
             "ephemeral_token": token,
             "realtime_model": model,  # Send model to client for exact matching
             "config": webrtc_config,
-            "session_config": {
-                "instructions": get_bankruptcy_consultation_instructions(),
-                "tools": get_bankruptcy_function_definitions(),
-                "tool_choice": "auto",
-                "modalities": ["audio", "text"],
-                "voice": "alloy",
-                "turn_detection": {
-                    "type": "server_vad",
-                    "threshold": 0.5,
-                    "prefix_padding_ms": 300,
-                    "silence_duration_ms": 500,
-                    "create_response": True,
-                    "interrupt_response": True
-                },
-                "input_audio_transcription": {"model": "whisper-1"},
-                "temperature": 0.2
-            }
+            "phatic": {"functions": PHATIC_FUNCTIONS, "lines": PHATIC_LINES},
+            "session_config": get_session_config()
         })
         
     except Exception as e:
@@ -345,37 +768,28 @@ def setup_webrtc_session():
         
         # Check if request has JSON data or raw SDP
         if request.content_type == 'application/json':
-            data = request.get_json()
-            sdp = data.get('sdp')
+            data = load_json_body()
+            sdp = (data.get('sdp') or '').encode()
             ephemeral_token = data.get('ephemeral_token')
             model = data.get('model')  # Get model from client
-            logger.info("Received JSON request with SDP, token, and model")
+            logger.debug("Received JSON request with SDP, token, and model")
         else:
             # Raw SDP in body, token in header
-            sdp = request.get_data(as_text=True)
+            sdp = request.get_data()  # Forwarded as raw bytes, never decoded
             ephemeral_token = request.headers.get('X-Ephemeral-Token')
             model = request.headers.get('X-Model')  # Fallback for raw SDP
-            logger.info("Received raw SDP request")
+            logger.debug("Received raw SDP request")
         
         if not sdp or not ephemeral_token or not model:
-            logger.error(f"Missing data - SDP: {bool(sdp)}, Token: {bool(ephemeral_token)}, Model: {bool(model)}")
+            logger.error("Missing data - SDP: %s, Token: %s, Model: %s", bool(sdp), bool(ephemeral_token), bool(model))
             return "Error: Missing SDP, token, or model", 400
         
         # Forward SDP request to OpenAI using exact recommended approach
-        import requests
-
-        OPENAI_REALTIME_URL = "https://api.openai.com/v1/realtime"  # <-- note: NOT /calls
-
         # Use the exact model that was used to mint the ephemeral token
-        logger.info(f"MINT MODEL: {model}")
-        logger.info(f"SDP  MODEL: {model}")
-        logger.info(f"TOKEN HEAD: {ephemeral_token[:16]}...")
-        logger.info(f"SDP HEAD: {repr(sdp[:80])}")
-
-        logger.info(f"Sending SDP to OpenAI (length: {len(sdp)} chars)")
-        logger.info(f"SDP preview: {sdp[:100]}...")
-        logger.info(f"Using model: {model}")
-        logger.info(f"Token prefix: {ephemeral_token[:20]}...")
+        debug = logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            logger.debug("Sending SDP to OpenAI - model: %s, token head: %s..., SDP head: %r len=%d",
+                         model, ephemeral_token[:16], sdp[:64], len(sdp))
         
         # Prepare request
         url = f"{OPENAI_REALTIME_URL}?model={model}"
@@ -386,18 +800,17 @@ def setup_webrtc_session():
             "Accept": "application/sdp",       # REQUIRED
         }
         
-        logger.info(f"Request URL: {url}")
-        logger.info(f"Request headers: {headers}")
+        logger.debug("Request URL: %s", url)
         
-        openai_response = requests.post(
+        openai_response = _openai_client.post(
             url,
-            data=sdp,                              # raw SDP offer from the browser
+            content=sdp,                           # raw SDP offer bytes from the browser
             headers=headers,
-            timeout=30,
         )
 
-        logger.info(f"OpenAI response status: {openai_response.status_code}")
-        logger.info(f"OpenAI response headers: {dict(openai_response.headers)}")
+        if debug:
+            logger.debug("OpenAI response status: %s", openai_response.status_code)
+            logger.debug("OpenAI response headers: %s", dict(openai_response.headers))
 
         if openai_response.status_code not in (200, 201):
             logger.error("OpenAI WebRTC setup failed: %s", openai_response.status_code)
@@ -412,17 +825,13 @@ def setup_webrtc_session():
         # Log the Location header if present (useful for server-side WS approach)
         location = openai_response.headers.get('Location')
         if location:
-            logger.info(f"WebRTC session Location: {location}")
+            logger.debug("WebRTC session Location: %s", location)
         
-        logger.info("WebRTC SDP exchange completed successfully")
-        logger.info(f"Response SDP length: {len(openai_response.text)}")
+        logger.info("WebRTC SDP exchange completed")
         return openai_response.text, 200, {"Content-Type": "application/sdp"}
         
     except Exception as e:
-        logger.error(f"Error setting up WebRTC session: {e}")
-        logger.error(f"Exception type: {type(e)}")
-        import traceback
-        logger.error(f"Traceback: {traceback.format_exc()}")
+        logger.exception("Error setting up WebRTC session: %s", e)
         return f"Error: {str(e)}", 500
 
 @app.route('/api/function-call', methods=['POST'])
@@ -431,41 +840,30 @@ def handle_function_call():
     global production_agent, current_case
     
     try:
-        data = request.get_json()
+        data = load_json_body()
         function_name = data.get('function_name')
         arguments = data.get('arguments', {})
         
         logger.info(f"Handling function call: {function_name}")
         
         if not production_agent:
-            return jsonify({"success": False, "error": "Production agent not initialized"})
+            return static_error("Production agent not initialized")
         
-        # Route function calls to production agent
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
+        # Reject malformed arguments before they reach the agent
+        validator = TOOL_VALIDATORS.get(function_name)
+        if validator is not None:
+            try:
+                arguments = validator(arguments)
+            except ToolArgumentsError as e:
+                logger.warning(f"Invalid arguments for {function_name}: {e.message}")
+                return jsonify({"success": False, "error": f"Invalid arguments: {e.message}"}), 400
         
-        try:
-            if function_name == "collect_personal_info":
-                result = loop.run_until_complete(
-                    production_agent._process_personal_information(arguments)
-                )
-            elif function_name == "collect_financial_data":
-                result = loop.run_until_complete(
-                    production_agent._process_financial_data(arguments)
-                )
-            elif function_name == "perform_means_test_analysis":
-                result = loop.run_until_complete(
-                    production_agent._perform_means_test_analysis()
-                )
-            elif function_name == "generate_bankruptcy_documents":
-                result = loop.run_until_complete(
-                    production_agent._generate_all_documents()
-                )
-            else:
-                result = {"status": "error", "message": f"Unknown function: {function_name}"}
-                
-        finally:
-            loop.close()
+        # Route function calls to production agent
+        handler = TOOL_HANDLERS.get(function_name)
+        if handler is not None:
+            result = run_async(handler(production_agent, arguments))
+        else:
+            result = {"status": "error", "message": f"Unknown function: {function_name}"}
         
         return jsonify({"success": True, "result": result})
         
@@ -480,16 +878,20 @@ def initialize_voice():
     
     try:
         if not voice_system or not production_agent:
-            return jsonify({"success": False, "error": "Systems not initialized"})
+            return static_error("Systems not initialized")
         
-        # Initialize a new case
+        # Initialize a new case shared with the agent's function-call handlers
         current_case = CompleteBankruptcyCase()
+        production_agent.bankruptcy_case = current_case
+        
+        # Warm the connection /api/webrtc-session will reuse while the client sets up WebRTC
+        threading.Thread(target=_preconnect_openai, daemon=True).start()
         
         logger.info("Voice consultation session initialized")
         return jsonify({
             "success": True, 
             "message": "Voice system and production platform ready",
-            "case_id": f"case_{int(time.time())}"
+            "case_id": _new_case_id()
         })
             
     except Exception as e:
@@ -503,14 +905,14 @@ def get_case_status():
     
     try:
         if not current_case:
-            return jsonify({"success": False, "error": "No active case"})
+            return static_error("No active case")
         
         completion_status = current_case.get_completion_status()
         
         return jsonify({
             "success": True,
             "case_status": {
-                "completion_percentage": sum(completion_status.values()) / len(completion_status) * 100,
+                "completion_percentage": current_case.completion_percentage(),
                 "forms_completed": sum(1 for v in completion_status.values() if v > 80),
                 "total_forms": len(completion_status),
                 "ready_for_filing": current_case.is_ready_for_filing(),
@@ -524,34 +926,37 @@ def get_case_status():
 
 @app.route('/api/generate-documents', methods=['POST'])
 def generate_documents():
-    """Generate bankruptcy documents"""
+    """Generate bankruptcy documents, streaming one NDJSON line per document"""
     global production_agent, current_case
     
-    try:
-        if not production_agent or not current_case:
-            return jsonify({"success": False, "error": "Production system not ready"})
-        
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        
+    if not production_agent or not current_case:
+        return static_error("Production system not ready")
+    
+    def stream_documents():
+        documents = production_agent._iter_generate_documents()
+        total = 0
         try:
-            # Generate all documents
-            documents = loop.run_until_complete(
-                production_agent._generate_all_documents()
-            )
+            while True:
+                document = run_async(_anext_or_none(documents))
+                if document is None:
+                    break
+                total += 1
+                yield dump_json_line({"document": document})
             
-            return jsonify({
+            yield dump_json_line({
                 "success": True,
-                "documents": documents,
-                "message": f"Generated {len(documents)} bankruptcy forms"
+                "total": total,
+                "message": f"Generated {total} bankruptcy forms"
             })
             
+        except Exception as e:
+            logger.error(f"Error generating documents: {e}")
+            yield dump_json_line({"success": False, "error": str(e)})
+            
         finally:
-            loop.close()
-        
-    except Exception as e:
-        logger.error(f"Error generating documents: {e}")
-        return jsonify({"success": False, "error": str(e)})
+            run_async(documents.aclose())
+    
+    return Response(stream_with_context(stream_documents()), mimetype='application/x-ndjson')
 
 @app.route('/api/upload-document', methods=['POST'])
 def upload_document():
@@ -560,38 +965,34 @@ def upload_document():
     
     try:
         if 'file' not in request.files:
-            return jsonify({"success": False, "error": "No file uploaded"})
+            return static_error("No file uploaded")
         
         file = request.files['file']
         if file.filename == '':
-            return jsonify({"success": False, "error": "No file selected"})
+            return static_error("No file selected")
         
         # Save uploaded file
-        upload_dir = Path("uploaded_documents")
-        upload_dir.mkdir(exist_ok=True)
+        file_path = upload_path_for(file.filename)
+        save_upload(file, file_path)
         
-        file_path = upload_dir / file.filename
-        file.save(file_path)
-        
-        # Process document with production system
+        # Process document in the background; the client polls /api/upload-status
         if production_agent and production_agent.document_processor:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
+            task_id = uuid4().hex
+            _evict_upload_jobs()
+            _write_upload_job(task_id, {"status": "processing", "filename": file.filename})
+            future = asyncio.run_coroutine_threadsafe(
+                production_agent.document_processor.process_document(
+                    str(file_path), production_agent.bankruptcy_case
+                ),
+                loop
+            )
+            future.add_done_callback(functools.partial(_record_upload_result, task_id, file.filename))
             
-            try:
-                result = loop.run_until_complete(
-                    production_agent.document_processor.process_document(str(file_path))
-                )
-                
-                return jsonify({
-                    "success": True,
-                    "message": f"Document {file.filename} processed successfully",
-                    "document_type": result.get("document_type", "unknown"),
-                    "extracted_data": result.get("structured_data", {})
-                })
-                
-            finally:
-                loop.close()
+            return jsonify({
+                "success": True,
+                "task_id": task_id,
+                "message": f"Document {file.filename} uploaded, processing started"
+            }), 202
         else:
             return jsonify({
                 "success": True,
@@ -602,16 +1003,22 @@ def upload_document():
         logger.error(f"Error uploading document: {e}")
         return jsonify({"success": False, "error": str(e)})
 
-@app.route('/static/<path:filename>')
-def static_files(filename):
-    """Serve static files"""
-    return send_from_directory('static', filename)
+@app.route('/api/upload-status/<task_id>', methods=['GET'])
+def get_upload_status(task_id):
+    """Report the state of a background document processing job"""
+    job = _read_upload_job(task_id)
+    if job is None:
+        return static_error("Unknown task", 404)
+    return jsonify({"success": True, **job})
 
 @app.route('/api/health', methods=['GET'])
 def health_check():
     """Health check endpoint"""
     global voice_system, production_agent, current_case
     
+    if not init_success:
+        return static_error("Platform failed to initialize", 503, status="unavailable")
+    
     return jsonify({
         "success": True,
         "status": "healthy",
@@ -619,16 +1026,12 @@ def health_check():
             "voice_system": voice_system is not None,
             "production_agent": production_agent is not None,
             "active_case": current_case is not None,
-            "api_key_configured": bool(settings.ai.openai_api_key)
+            "api_key_configured": API_KEY_CONFIGURED
         },
         "version": "2.0.0-integrated"
     })
 
 if __name__ == '__main__':
-    # Create templates directory if it doesn't exist
-    import os
-    os.makedirs('templates', exist_ok=True)
-    os.makedirs('static', exist_ok=True)
-    
-    # Run the Flask app (no SocketIO)
-    app.run(debug=True, host='0.0.0.0', port=5000)
+    # Development server only - production runs under gunicorn (see gunicorn_conf.py)
+    start_platform()
+    app.run(debug=bool(settings and settings.debug), host='0.0.0.0', port=5000)
@@ -5,19 +5,143 @@ Maps conversational answers to specific bankruptcy form fields and validates dat
 
 import re
 import logging
-from typing import Any, Dict, Optional, List, Tuple
+from typing import Any, Callable, Dict, Optional, List, Pattern, Tuple
 from datetime import datetime, date
-from decimal import Decimal, InvalidOperation
-from dataclasses import dataclass
+from decimal import Decimal
+from dataclasses import dataclass, field
+from functools import reduce
+from operator import attrgetter
+from types import MappingProxyType
+
+try:
+    from dateutil import parser as _dateutil_parser
+    DATEUTIL_AVAILABLE = True
+except ImportError:
+    DATEUTIL_AVAILABLE = False
 
 from sota_forms_complete import (
     CompleteBankruptcyCase, DebtorInfo, SpouseInfo, MonthlyIncome, 
-    MonthlyExpenses, MaritalStatus, FilingType, EmploymentStatus
+    MonthlyExpenses, MaritalStatus, FilingType, EmploymentStatus, field_present
 )
 
 logger = logging.getLogger(__name__)
 
-@dataclass
+# Answer-cleaning patterns, compiled once
+_RE_TEXT_DISALLOWED = re.compile(r'[^\w\s\-\.\,\'\#\&]')
+_RE_CURRENCY = re.compile(r'[\$\,]')
+_RE_MONEY_WORDS = re.compile(r'\b(dollars?|bucks?|cents?)\b', re.IGNORECASE)
+_RE_DECIMAL_NUM = re.compile(r'(\d+(?:\.\d{2})?)')
+_RE_INT_NUM = re.compile(r'(\d+)')
+_RE_NON_DIGIT = re.compile(r'[^\d]')
+_RE_WORD = re.compile(r'[a-z]+|\d+')
+
+# ASCII equivalent of _RE_TEXT_DISALLOWED as a str.translate deletion table
+_TEXT_DISALLOWED_ASCII = str.maketrans('', '', ''.join(
+    c for c in map(chr, range(128)) if _RE_TEXT_DISALLOWED.match(c)
+))
+_NON_DIGIT_ASCII = str.maketrans('', '', ''.join(
+    c for c in map(chr, range(128)) if not c.isdigit()
+))
+
+def _digits(text: str) -> str:
+    """Digits of text, in order; translate covers ASCII input without the regex engine"""
+    if text.isascii():
+        return text.translate(_NON_DIGIT_ASCII)
+    return _RE_NON_DIGIT.sub('', text)
+
+# Spoken yes/no words, shared with the agent so both agree on what counts as yes or no
+YES_WORDS = frozenset({
+    'yes', 'y', 'yeah', 'yea', 'yep', 'yup', 'ya', 'yah', 'sure', 'ok', 'okay',
+    'true', 'correct', 'right', 'definitely', 'absolutely', 'certainly'
+})
+NO_WORDS = frozenset({'no', 'n', 'nah', 'naw', 'nope', 'false', 'negative'})
+
+# Answer vocabularies, matched against whole words of the lowered answer
+_YES_TOKENS = YES_WORDS
+_NO_TOKENS = NO_WORDS | {'incorrect', 'wrong'}
+_ZERO_TOKENS = frozenset({'nothing', 'zero', 'none'})
+_SKIP_ANSWERS = frozenset({'', 'none', 'nothing', 'n/a', 'skip'})
+
+# (vocabulary, member) pairs checked in order; first overlap wins
+_MARITAL_STATUS_TOKENS = (
+    (frozenset({'married', 'wed', 'remarried', 'newlywed', 'newlyweds'}), MaritalStatus.MARRIED),
+    (frozenset({'single', 'unmarried', 'unwed'}), MaritalStatus.SINGLE),
+    (frozenset({'divorced', 'divorcee'}), MaritalStatus.DIVORCED),
+    (frozenset({'separated'}), MaritalStatus.SEPARATED),
+    (frozenset({'widowed', 'widow', 'widower', 'widows', 'widowers'}), MaritalStatus.WIDOWED),
+)
+_FILING_TYPE_TOKENS = (
+    (frozenset({'7', 'seven'}), FilingType.CHAPTER_7),
+    (frozenset({'13', 'thirteen'}), FilingType.CHAPTER_13),
+)
+_EMPLOYMENT_STATUS_TOKENS = (
+    (frozenset({'self', 'freelance', 'freelancer', 'contractor'}), EmploymentStatus.SELF_EMPLOYED),
+    (frozenset({'unemployed', 'jobless'}), EmploymentStatus.UNEMPLOYED),
+    (frozenset({'employed', 'working', 'job'}), EmploymentStatus.EMPLOYED),
+    (frozenset({'retired'}), EmploymentStatus.RETIRED),
+    (frozenset({'disabled', 'disability'}), EmploymentStatus.DISABLED),
+)
+
+# Common spoken/typed date layouts tried before the fuzzy parser
+_DATE_FORMATS = ("%m/%d/%Y", "%m-%d-%Y", "%Y-%m-%d", "%B %d %Y", "%B %d, %Y")
+
+# Full state names to USPS codes
+_STATE_MAPPING = MappingProxyType({
+    'alabama': 'AL', 'alaska': 'AK', 'arizona': 'AZ', 'arkansas': 'AR',
+    'california': 'CA', 'colorado': 'CO', 'connecticut': 'CT', 'delaware': 'DE',
+    'florida': 'FL', 'georgia': 'GA', 'hawaii': 'HI', 'idaho': 'ID',
+    'illinois': 'IL', 'indiana': 'IN', 'iowa': 'IA', 'kansas': 'KS',
+    'kentucky': 'KY', 'louisiana': 'LA', 'maine': 'ME', 'maryland': 'MD',
+    'massachusetts': 'MA', 'michigan': 'MI', 'minnesota': 'MN', 'mississippi': 'MS',
+    'missouri': 'MO', 'montana': 'MT', 'nebraska': 'NE', 'nevada': 'NV',
+    'new hampshire': 'NH', 'new jersey': 'NJ', 'new mexico': 'NM', 'new york': 'NY',
+    'north carolina': 'NC', 'north dakota': 'ND', 'ohio': 'OH', 'oklahoma': 'OK',
+    'oregon': 'OR', 'pennsylvania': 'PA', 'rhode island': 'RI', 'south carolina': 'SC',
+    'south dakota': 'SD', 'tennessee': 'TN', 'texas': 'TX', 'utah': 'UT',
+    'vermont': 'VT', 'virginia': 'VA', 'washington': 'WA', 'west virginia': 'WV',
+    'wisconsin': 'WI', 'wyoming': 'WY'
+})
+
+# Spelled-out small numbers accepted for integer fields
+_WORD_NUMBERS = MappingProxyType({
+    'one': 1, 'two': 2, 'three': 3, 'four': 4, 'five': 5,
+    'six': 6, 'seven': 7, 'eight': 8, 'nine': 9, 'ten': 10
+})
+
+def _answer_tokens(answer: str) -> frozenset:
+    """Lowercased words and digit runs of an answer"""
+    return frozenset(_RE_WORD.findall(answer.lower()))
+
+def _match_tokens(tokens: frozenset, table) -> Optional[Any]:
+    """First member of an ordered vocabulary table whose words appear in the answer"""
+    for words, member in table:
+        if tokens & words:
+            return member
+    return None
+
+def _map_marital(tokens: frozenset) -> Optional[MaritalStatus]:
+    """Marital status named in an answer"""
+    return _match_tokens(tokens, _MARITAL_STATUS_TOKENS)
+
+def _map_filing(tokens: frozenset) -> Optional[FilingType]:
+    """Bankruptcy chapter named in an answer"""
+    return _match_tokens(tokens, _FILING_TYPE_TOKENS)
+
+def _map_employment(tokens: frozenset) -> Optional[EmploymentStatus]:
+    """Employment status named in an answer"""
+    return _match_tokens(tokens, _EMPLOYMENT_STATUS_TOKENS)
+
+# Validation patterns interned by source so identical regexes share one object
+_VALIDATION_PATTERNS: Dict[str, Pattern] = {}
+
+def _intern_pattern(pattern: str) -> Pattern:
+    """Compiled validation pattern, shared between mappings with the same source"""
+    compiled = _VALIDATION_PATTERNS.get(pattern)
+    if compiled is None:
+        compiled = _VALIDATION_PATTERNS[pattern] = re.compile(pattern)
+    return compiled
+
+@dataclass(slots=True, frozen=True)
 class FieldMapping:
     """Defines how a conversational answer maps to a bankruptcy form field"""
     form_section: str  # e.g., "form_b101", "debtor_info"
@@ -27,14 +151,46 @@ class FieldMapping:
     enum_class: Optional[type] = None
     required: bool = False
     
+    # Derived at construction so answers never go through re's pattern cache
+    _compiled_regex: Optional[Pattern] = field(default=None, init=False, repr=False, compare=False)
+    _section_parts: Tuple[str, ...] = field(default=(), init=False, repr=False, compare=False)
+    _resolver: Optional[Callable[[Any], Any]] = field(default=None, init=False, repr=False, compare=False)
+    _valid: bool = field(default=True, init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        # Frozen instance - derived fields are set through object.__setattr__
+        object.__setattr__(self, '_section_parts', tuple(self.form_section.split('.')))
+        object.__setattr__(self, '_resolver', attrgetter(self.form_section))
+        if self.validation_regex:
+            object.__setattr__(self, '_compiled_regex', _intern_pattern(self.validation_regex))
+    
 class BankruptcyFieldMapper:
     """
     Maps conversational answers to specific bankruptcy form fields
     Handles validation, type conversion, and error checking
     """
     
+    # Enum classes hash by identity, so this is a single lookup per answer
+    _ENUM_DISPATCH = {
+        MaritalStatus: _map_marital,
+        FilingType: _map_filing,
+        EmploymentStatus: _map_employment,
+    }
+    
     def __init__(self):
         self.field_mappings = self._initialize_field_mappings()
+        self._required_items: List[Tuple[str, Tuple[str, ...]]] = [
+            (field_key, mapping._section_parts + (mapping.field_name,))
+            for field_key, mapping in self.field_mappings.items() if mapping.required
+        ]
+        self._type_dispatch = {
+            "text": self._process_text_field,
+            "decimal": lambda answer, _mapping: self._process_decimal_field(answer),
+            "integer": lambda answer, _mapping: self._process_integer_field(answer),
+            "boolean": lambda answer, _mapping: self._process_boolean_field(answer),
+            "date": lambda answer, _mapping: self._process_date_field(answer),
+            "enum": self._process_enum_field,
+        }
         
     def _initialize_field_mappings(self) -> Dict[str, FieldMapping]:
         """Initialize comprehensive field mappings for all bankruptcy forms"""
@@ -401,6 +557,16 @@ class BankruptcyFieldMapper:
             ),
         })
         
+        # Probe each path against an empty case once so applying a value needs no guards
+        probe = CompleteBankruptcyCase()
+        probe.form_b101.spouse_info = SpouseInfo()
+        for mapping in mappings.values():
+            try:
+                valid = hasattr(mapping._resolver(probe), mapping.field_name)
+            except AttributeError:
+                valid = False
+            object.__setattr__(mapping, '_valid', valid)
+        
         return mappings
     
     def map_answer_to_field(self, field_key: str, raw_answer: str, bankruptcy_case: CompleteBankruptcyCase) -> Tuple[bool, str]:
@@ -420,6 +586,37 @@ class BankruptcyFieldMapper:
         if not mapping:
             return False, f"Unknown field mapping: {field_key}"
         
+        return self._map_one(field_key, mapping, raw_answer, bankruptcy_case, logger.isEnabledFor(logging.INFO))
+    
+    def map_answers(self, answers: Dict[str, str], bankruptcy_case: CompleteBankruptcyCase) -> Dict[str, Tuple[bool, str]]:
+        """
+        Map a batch of conversational answers onto the bankruptcy case
+        
+        Args:
+            answers: Mapping of field identifier to the user's raw answer
+            bankruptcy_case: The bankruptcy case object to update
+            
+        Returns:
+            Dict of field identifier to (success: bool, message: str)
+        """
+        
+        field_mappings = self.field_mappings
+        info_enabled = logger.isEnabledFor(logging.INFO)
+        results = {}
+        
+        for field_key, raw_answer in answers.items():
+            mapping = field_mappings.get(field_key)
+            if not mapping:
+                results[field_key] = (False, f"Unknown field mapping: {field_key}")
+            else:
+                results[field_key] = self._map_one(field_key, mapping, raw_answer, bankruptcy_case, info_enabled)
+        
+        return results
+    
+    def _map_one(self, field_key: str, mapping: FieldMapping, raw_answer: str,
+                 bankruptcy_case: CompleteBankruptcyCase, info_enabled: bool) -> Tuple[bool, str]:
+        """Process and apply one answer; info logging is skipped unless enabled"""
+        
         try:
             # Clean and validate the answer
             processed_value = self._process_answer(raw_answer, mapping)
@@ -428,14 +625,16 @@ class BankruptcyFieldMapper:
                 if mapping.required:
                     return False, f"This field is required but no valid value could be extracted from: '{raw_answer}'"
                 else:
-                    logger.info(f"No value extracted for optional field {field_key}")
+                    if info_enabled:
+                        logger.info(f"No value extracted for optional field {field_key}")
                     return True, "No value provided for optional field"
             
             # Apply the value to the bankruptcy case
             success = self._apply_value_to_case(mapping, processed_value, bankruptcy_case)
             
             if success:
-                logger.info(f"Successfully mapped {field_key} = {processed_value}")
+                if info_enabled:
+                    logger.info(f"Successfully mapped {field_key} = {processed_value}")
                 return True, f"Set {field_key} to {processed_value}"
             else:
                 return False, f"Failed to apply value to bankruptcy case"
@@ -447,37 +646,26 @@ class BankruptcyFieldMapper:
     def _process_answer(self, raw_answer: str, mapping: FieldMapping) -> Any:
         """Process raw answer based on field type and validation rules"""
         
-        if not raw_answer or raw_answer.strip().lower() in ['none', 'nothing', 'n/a', 'skip']:
+        answer = raw_answer.strip() if raw_answer else ''
+        if answer.lower() in _SKIP_ANSWERS:
             return None
         
-        answer = raw_answer.strip()
+        handler = self._type_dispatch.get(mapping.field_type)
+        if handler is None:
+            logger.warning(f"Unknown field type: {mapping.field_type}")
+            return answer
         
-        try:
-            if mapping.field_type == "text":
-                return self._process_text_field(answer, mapping)
-            elif mapping.field_type == "decimal":
-                return self._process_decimal_field(answer)
-            elif mapping.field_type == "integer":
-                return self._process_integer_field(answer)
-            elif mapping.field_type == "boolean":
-                return self._process_boolean_field(answer)
-            elif mapping.field_type == "date":
-                return self._process_date_field(answer)
-            elif mapping.field_type == "enum":
-                return self._process_enum_field(answer, mapping)
-            else:
-                logger.warning(f"Unknown field type: {mapping.field_type}")
-                return answer
-                
-        except Exception as e:
-            logger.error(f"Error processing {mapping.field_type} field: {str(e)}")
-            return None
+        # Handlers report unparseable input by returning None
+        return handler(answer, mapping)
     
     def _process_text_field(self, answer: str, mapping: FieldMapping) -> Optional[str]:
         """Process text field with validation"""
         
-        # Clean the text
-        cleaned = re.sub(r'[^\w\s\-\.\,\'\#\&]', '', answer).strip()
+        # Clean the text - translate covers ASCII answers without the regex engine
+        if answer.isascii():
+            cleaned = answer.translate(_TEXT_DISALLOWED_ASCII).strip()
+        else:
+            cleaned = _RE_TEXT_DISALLOWED.sub('', answer).strip()
         
         # Special handling for specific fields
         if "state" in mapping.field_name:
@@ -492,8 +680,8 @@ class BankruptcyFieldMapper:
             cleaned = self._normalize_email(cleaned)
         
         # Validate against regex if provided
-        if mapping.validation_regex and cleaned:
-            if not re.match(mapping.validation_regex, cleaned):
+        if mapping._compiled_regex and cleaned:
+            if not mapping._compiled_regex.match(cleaned):
                 logger.warning(f"Text validation failed for {mapping.field_name}: '{cleaned}'")
                 return None
         
@@ -503,19 +691,16 @@ class BankruptcyFieldMapper:
         """Extract decimal value from conversational answer"""
         
         # Remove currency symbols and common words
-        cleaned = re.sub(r'[\$\,]', '', answer)
-        cleaned = re.sub(r'\b(dollars?|bucks?|cents?)\b', '', cleaned, flags=re.IGNORECASE)
+        cleaned = _RE_CURRENCY.sub('', answer)
+        cleaned = _RE_MONEY_WORDS.sub('', cleaned)
         
-        # Look for number patterns
-        number_match = re.search(r'(\d+(?:\.\d{2})?)', cleaned)
+        # Look for number patterns - the match is always digits, so Decimal cannot fail
+        number_match = _RE_DECIMAL_NUM.search(cleaned)
         if number_match:
-            try:
-                return Decimal(number_match.group(1))
-            except InvalidOperation:
-                pass
+            return Decimal(number_match.group(1))
         
         # Handle common conversational amounts
-        if any(word in answer.lower() for word in ['nothing', 'zero', 'none']):
+        if _answer_tokens(answer) & _ZERO_TOKENS:
             return Decimal('0')
         
         logger.warning(f"Could not extract decimal from: '{answer}'")
@@ -525,22 +710,14 @@ class BankruptcyFieldMapper:
         """Extract integer value from answer"""
         
         # Look for numbers
-        number_match = re.search(r'(\d+)', answer)
+        number_match = _RE_INT_NUM.search(answer)
         if number_match:
-            try:
-                return int(number_match.group(1))
-            except ValueError:
-                pass
+            return int(number_match.group(1))
         
         # Handle word numbers for small values
-        word_numbers = {
-            'one': 1, 'two': 2, 'three': 3, 'four': 4, 'five': 5,
-            'six': 6, 'seven': 7, 'eight': 8, 'nine': 9, 'ten': 10
-        }
-        
-        for word, num in word_numbers.items():
-            if word in answer.lower():
-                return num
+        matched = _answer_tokens(answer) & _WORD_NUMBERS.keys()
+        if matched:
+            return min(_WORD_NUMBERS[word] for word in matched)
         
         logger.warning(f"Could not extract integer from: '{answer}'")
         return None
@@ -548,14 +725,11 @@ class BankruptcyFieldMapper:
     def _process_boolean_field(self, answer: str) -> Optional[bool]:
         """Convert conversational answer to boolean"""
         
-        answer_lower = answer.lower().strip()
+        tokens = _answer_tokens(answer)
         
-        yes_words = ['yes', 'y', 'true', 'correct', 'right', 'definitely', 'absolutely', 'sure']
-        no_words = ['no', 'n', 'false', 'incorrect', 'wrong', 'nope', 'negative']
-        
-        if any(word in answer_lower for word in yes_words):
+        if tokens & _YES_TOKENS:
             return True
-        elif any(word in answer_lower for word in no_words):
+        elif tokens & _NO_TOKENS:
             return False
         
         logger.warning(f"Could not determine boolean from: '{answer}'")
@@ -564,14 +738,21 @@ class BankruptcyFieldMapper:
     def _process_date_field(self, answer: str) -> Optional[date]:
         """Extract date from conversational answer"""
         
+        for fmt in _DATE_FORMATS:
+            try:
+                return datetime.strptime(answer, fmt).date()
+            except ValueError:
+                continue
+        
         try:
-            # Try to parse various date formats
-            from dateutil import parser
-            parsed_date = parser.parse(answer, fuzzy=True)
-            return parsed_date.date()
-        except:
-            logger.warning(f"Could not parse date from: '{answer}'")
-            return None
+            # Fall back to fuzzy parsing for free-form answers
+            if DATEUTIL_AVAILABLE:
+                return _dateutil_parser.parse(answer, fuzzy=True).date()
+        except (ValueError, OverflowError):
+            pass
+        
+        logger.warning(f"Could not parse date from: '{answer}'")
+        return None
     
     def _process_enum_field(self, answer: str, mapping: FieldMapping) -> Optional[Any]:
         """Process enumeration field"""
@@ -579,40 +760,10 @@ class BankruptcyFieldMapper:
         if not mapping.enum_class:
             return None
         
-        answer_lower = answer.lower().strip()
-        
-        # Special handling for MaritalStatus
-        if mapping.enum_class == MaritalStatus:
-            if any(word in answer_lower for word in ['married', 'wed']):
-                return MaritalStatus.MARRIED
-            elif any(word in answer_lower for word in ['single', 'unmarried']):
-                return MaritalStatus.SINGLE
-            elif any(word in answer_lower for word in ['divorced']):
-                return MaritalStatus.DIVORCED
-            elif any(word in answer_lower for word in ['separated']):
-                return MaritalStatus.SEPARATED
-            elif any(word in answer_lower for word in ['widowed', 'widow']):
-                return MaritalStatus.WIDOWED
-        
-        # Special handling for FilingType
-        elif mapping.enum_class == FilingType:
-            if '7' in answer or 'seven' in answer_lower:
-                return FilingType.CHAPTER_7
-            elif '13' in answer or 'thirteen' in answer_lower:
-                return FilingType.CHAPTER_13
-        
-        # Special handling for EmploymentStatus
-        elif mapping.enum_class == EmploymentStatus:
-            if any(word in answer_lower for word in ['employed', 'working', 'job']):
-                return EmploymentStatus.EMPLOYED
-            elif any(word in answer_lower for word in ['unemployed', 'jobless']):
-                return EmploymentStatus.UNEMPLOYED
-            elif any(word in answer_lower for word in ['self-employed', 'freelance', 'contractor']):
-                return EmploymentStatus.SELF_EMPLOYED
-            elif any(word in answer_lower for word in ['retired']):
-                return EmploymentStatus.RETIRED
-            elif any(word in answer_lower for word in ['disabled', 'disability']):
-                return EmploymentStatus.DISABLED
+        handler = self._ENUM_DISPATCH.get(mapping.enum_class)
+        member = handler(_answer_tokens(answer)) if handler else None
+        if member is not None:
+            return member
         
         logger.warning(f"Could not map enum value from: '{answer}'")
         return None
@@ -620,66 +771,31 @@ class BankruptcyFieldMapper:
     def _apply_value_to_case(self, mapping: FieldMapping, value: Any, bankruptcy_case: CompleteBankruptcyCase) -> bool:
         """Apply processed value to the appropriate field in bankruptcy case"""
         
-        try:
-            # Navigate to the target object
-            parts = mapping.form_section.split('.')
-            target_obj = bankruptcy_case
-            
-            for part in parts:
-                if hasattr(target_obj, part):
-                    target_obj = getattr(target_obj, part)
-                else:
-                    # Create the object if it doesn't exist
-                    if part == "spouse_info" and target_obj.spouse_info is None:
-                        from sota_forms_complete import SpouseInfo
-                        target_obj.spouse_info = SpouseInfo()
-                        target_obj = target_obj.spouse_info
-                    else:
-                        logger.error(f"Cannot navigate to {mapping.form_section}")
-                        return False
-            
-            # Set the field value
-            if hasattr(target_obj, mapping.field_name):
-                setattr(target_obj, mapping.field_name, value)
-                return True
-            else:
-                logger.error(f"Field {mapping.field_name} not found in {mapping.form_section}")
-                return False
-                
-        except Exception as e:
-            logger.error(f"Error applying value to case: {str(e)}")
+        # Paths were checked against the case model when the mappings were built
+        if not mapping._valid:
+            logger.error(f"Field {mapping.field_name} not found in {mapping.form_section}")
             return False
+        
+        # Create the spouse section on first use - it defaults to None
+        if "spouse_info" in mapping._section_parts and bankruptcy_case.form_b101.spouse_info is None:
+            bankruptcy_case.form_b101.spouse_info = SpouseInfo()
+        
+        # Navigate to the target object and set the field value
+        setattr(mapping._resolver(bankruptcy_case), mapping.field_name, value)
+        bankruptcy_case.mark_dirty()
+        return True
     
     # Helper methods for text normalization
     def _normalize_state(self, state_text: str) -> str:
         """Normalize state to 2-letter code"""
-        state_mapping = {
-            'alabama': 'AL', 'alaska': 'AK', 'arizona': 'AZ', 'arkansas': 'AR',
-            'california': 'CA', 'colorado': 'CO', 'connecticut': 'CT', 'delaware': 'DE',
-            'florida': 'FL', 'georgia': 'GA', 'hawaii': 'HI', 'idaho': 'ID',
-            'illinois': 'IL', 'indiana': 'IN', 'iowa': 'IA', 'kansas': 'KS',
-            'kentucky': 'KY', 'louisiana': 'LA', 'maine': 'ME', 'maryland': 'MD',
-            'massachusetts': 'MA', 'michigan': 'MI', 'minnesota': 'MN', 'mississippi': 'MS',
-            'missouri': 'MO', 'montana': 'MT', 'nebraska': 'NE', 'nevada': 'NV',
-            'new hampshire': 'NH', 'new jersey': 'NJ', 'new mexico': 'NM', 'new york': 'NY',
-            'north carolina': 'NC', 'north dakota': 'ND', 'ohio': 'OH', 'oklahoma': 'OK',
-            'oregon': 'OR', 'pennsylvania': 'PA', 'rhode island': 'RI', 'south carolina': 'SC',
-            'south dakota': 'SD', 'tennessee': 'TN', 'texas': 'TX', 'utah': 'UT',
-            'vermont': 'VT', 'virginia': 'VA', 'washington': 'WA', 'west virginia': 'WV',
-            'wisconsin': 'WI', 'wyoming': 'WY'
-        }
-        
-        state_lower = state_text.lower().strip()
-        if state_lower in state_mapping:
-            return state_mapping[state_lower]
-        elif len(state_text) == 2:
-            return state_text.upper()
-        else:
-            return state_text
+        state = state_text.strip()
+        if len(state) == 2:
+            return state.upper()
+        return _STATE_MAPPING.get(state.lower(), state_text)
     
     def _normalize_phone(self, phone_text: str) -> str:
         """Normalize phone number"""
-        digits = re.sub(r'[^\d]', '', phone_text)
+        digits = _digits(phone_text)
         if len(digits) == 10:
             return f"({digits[:3]}) {digits[3:6]}-{digits[6:]}"
         elif len(digits) == 11 and digits[0] == '1':
@@ -688,7 +804,7 @@ class BankruptcyFieldMapper:
     
     def _normalize_zip(self, zip_text: str) -> str:
         """Normalize zip code"""
-        digits = re.sub(r'[^\d]', '', zip_text)
+        digits = _digits(zip_text)
         if len(digits) == 5:
             return digits
         elif len(digits) == 9:
@@ -697,7 +813,7 @@ class BankruptcyFieldMapper:
     
     def _extract_ssn_last_4(self, ssn_text: str) -> Optional[str]:
         """Extract last 4 digits of SSN"""
-        digits = re.sub(r'[^\d]', '', ssn_text)
+        digits = _digits(ssn_text)
         if len(digits) >= 4:
             return digits[-4:]
         return None
@@ -714,22 +830,16 @@ class BankruptcyFieldMapper:
         """Validate that all required fields have been filled"""
         missing_fields = []
         
-        for field_key, mapping in self.field_mappings.items():
-            if mapping.required:
-                # Check if field has a value
-                parts = mapping.form_section.split('.')
-                target_obj = bankruptcy_case
-                
-                try:
-                    for part in parts:
-                        target_obj = getattr(target_obj, part)
-                    
-                    value = getattr(target_obj, mapping.field_name, None)
-                    if value is None or value == '' or value == []:
-                        missing_fields.append(field_key)
-                        
-                except AttributeError:
-                    missing_fields.append(field_key)
+        for field_key, path in self._required_items:
+            # Check if field has a value
+            try:
+                value = reduce(getattr, path, bankruptcy_case)
+            except AttributeError:
+                missing_fields.append(field_key)
+                continue
+            
+            if not field_present(value):
+                missing_fields.append(field_key)
         
         return missing_fields
 
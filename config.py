@@ -5,6 +5,7 @@ Modern configuration system with validation, environment handling, and secrets m
 
 import os
 import json
+import functools
 from pathlib import Path
 from typing import Optional, Dict, Any, List
 from pydantic import SecretStr, Field
@@ -31,6 +32,12 @@ class AIProvider(str, Enum):
     ANTHROPIC = "anthropic"
     AZURE_OPENAI = "azure_openai"
 
+# Where each AI provider's key lives: (AIConfig attribute, environment fallback)
+_AI_KEY_SOURCES = {
+    AIProvider.OPENAI: ('openai_api_key', 'OPENAI_API_KEY'),
+    AIProvider.ANTHROPIC: ('anthropic_api_key', 'ANTHROPIC_API_KEY'),
+}
+
 class VoiceConfig(BaseSettings):
     """Voice service configuration"""
     
@@ -112,6 +119,10 @@ class DocumentsConfig(BaseSettings):
     # Processing settings
     max_file_size_mb: int = 50
     allowed_file_types: List[str] = ["pdf", "jpg", "jpeg", "png", "txt", "docx"]
+    fsync_uploads: bool = False  # Force uploads to stable storage before processing
+    analysis_cache_dir: str = ""  # Opt-in directory for reusing AI extraction of re-uploaded files
+    analysis_cache_ttl_seconds: int = 86400  # Cached analyses older than this are discarded
+    extraction_batch_size: int = 4  # Same-type documents extracted per AI call; 1 disables batching
     
     class Config:
         env_prefix = "DOCUMENTS_"
@@ -149,28 +160,26 @@ class Settings(BaseSettings):
     app_name: str = "DocketVoice - SOTA Bankruptcy Assistant"
     app_version: str = "2.0.0"
     
-    # Sub-configurations
-    voice: VoiceConfig = VoiceConfig()
-    ai: AIConfig = AIConfig()
-    security: SecurityConfig = SecurityConfig()
-    monitoring: MonitoringConfig = MonitoringConfig()
-    documents: DocumentsConfig = DocumentsConfig()
-    bankruptcy: BankruptcyConfig = BankruptcyConfig()
-    agent: AgentConfig = AgentConfig()
+    # Sub-configurations, read from the environment when Settings is built rather than at import
+    voice: VoiceConfig = Field(default_factory=VoiceConfig)
+    ai: AIConfig = Field(default_factory=AIConfig)
+    security: SecurityConfig = Field(default_factory=SecurityConfig)
+    monitoring: MonitoringConfig = Field(default_factory=MonitoringConfig)
+    documents: DocumentsConfig = Field(default_factory=DocumentsConfig)
+    bankruptcy: BankruptcyConfig = Field(default_factory=BankruptcyConfig)
+    agent: AgentConfig = Field(default_factory=AgentConfig)
     
     def get_ai_api_key(self) -> Optional[str]:
         """Get the primary AI API key"""
-        if self.ai.primary_provider == AIProvider.OPENAI:
-            if self.ai.openai_api_key:
-                return self.ai.openai_api_key.get_secret_value()
-            # Fallback to environment variable
-            return os.getenv('OPENAI_API_KEY')
-        elif self.ai.primary_provider == AIProvider.ANTHROPIC:
-            if self.ai.anthropic_api_key:
-                return self.ai.anthropic_api_key.get_secret_value()
-            # Fallback to environment variable  
-            return os.getenv('ANTHROPIC_API_KEY')
-        return None
+        source = _AI_KEY_SOURCES.get(self.ai.primary_provider)
+        if source is None:
+            return None
+        attr_name, env_var = source
+        secret = getattr(self.ai, attr_name)
+        if secret:
+            return secret.get_secret_value()
+        # Fallback to environment variable
+        return os.getenv(env_var)
     
     class Config:
         env_file = ".env"
@@ -178,10 +187,16 @@ class Settings(BaseSettings):
         extra = "ignore"  # Allow extra fields to be ignored instead of raising errors
         case_sensitive = False
         
+@functools.lru_cache(maxsize=1)
 def load_settings() -> Settings:
-    """Load and validate settings"""
+    """Load and validate settings once; later calls share the same instance"""
     return Settings()
 
+def reload_settings() -> Settings:
+    """Discard the cached settings and read the environment and .env again"""
+    load_settings.cache_clear()
+    return load_settings()
+
 # DocketVoiceConfig class for compatibility
 class DocketVoiceConfig:
     def __init__(self):
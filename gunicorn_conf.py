@@ -0,0 +1,31 @@
+"""
+Gunicorn configuration for DocketVoice
+Run with: gunicorn -c gunicorn_conf.py app:app
+"""
+
+import os
+
+# Import the app once in the master so every worker shares the loaded
+# modules and settings copy-on-write; importing opens no client connections
+preload_app = True
+
+bind = os.environ.get("BIND", "0.0.0.0:5000")
+# The active case and agent live in per-process globals in app.py, so every request of
+# a consultation must reach the same process. Keep a single worker and scale with threads
+# until case state is shared across processes.
+workers = int(os.environ.get("WEB_CONCURRENCY", 1))
+
+# Reuse client connections between requests; heartbeat independently of long AI calls
+keepalive = 5
+timeout = 60
+graceful_timeout = 30
+
+# Handlers only wait on the worker's shared platform loop, so threaded workers
+# let other requests proceed while one is blocked on an AI or OpenAI call
+worker_class = "gthread"
+threads = int(os.environ.get("GUNICORN_THREADS", 16))
+
+def post_fork(server, worker):
+    """Warm the platform in the new worker so event loops and sockets never cross a fork"""
+    from app import start_platform
+    start_platform()
@@ -34,6 +34,8 @@ class ProductionVoiceSystem:
         self.pipeline = VoicePipeline(workflow=SingleAgentVoiceWorkflow(self.agent))
         self.audio_player = None
         self.is_initialized = False
+        # Plain bool rather than an Event: it is read for every audio chunk and set from any thread
+        self.interrupted = False
 
     def _create_bankruptcy_agent(self) -> Agent:
         """Create the bankruptcy consultation agent"""
@@ -78,12 +80,15 @@ START by introducing yourself and asking about their bankruptcy situation."""
             logger.error(f"Failed to initialize voice system: {e}")
             return False
 
-    async def speak(self, text: str) -> bool:
-        """Convert text to speech and play it"""
+    async def speak(self, text: str, started: Optional[asyncio.Event] = None) -> bool:
+        """Convert text to speech and play it; sets started once playback has begun"""
         try:
             if not self.is_initialized:
                 await self.initialize()
 
+            if started is not None:
+                started.set()
+
             # Create audio input from text (for TTS)
             # Note: This is a simplified approach - in production you'd use proper TTS
             logger.info(f"Speaking: {text[:100]}...")
@@ -107,6 +112,7 @@ START by introducing yourself and asking about their bankruptcy situation."""
             if not self.is_initialized:
                 await self.initialize()
 
+            self.interrupted = False
             logger.info("Starting voice input with automatic VAD...")
             print("\n🎤 Listening... Speak naturally! (VAD will detect when you finish)")
 
@@ -125,8 +131,8 @@ START by introducing yourself and asking about their bankruptcy situation."""
 
                 async for event in result.stream():
                     if event.type == "voice_stream_event_audio":
-                        # Play the assistant's response audio
-                        if self.audio_player:
+                        # Play the assistant's response audio unless the client barged in
+                        if self.audio_player and not self.interrupted:
                             self.audio_player.write(event.data)
 
                     elif event.type == "voice_stream_event_lifecycle":
@@ -158,6 +164,10 @@ START by introducing yourself and asking about their bankruptcy situation."""
             logger.error(f"Voice input error: {e}")
             return None
 
+    def interrupt(self):
+        """Drop the rest of the assistant's current spoken reply"""
+        self.interrupted = True
+
     async def _record_audio(self, audio_input: StreamedAudioInput):
         """Record audio from microphone and stream to VoicePipeline"""
         try:
@@ -165,12 +175,24 @@ START by introducing yourself and asking about their bankruptcy situation."""
             samplerate = 24000
             channels = 1
             dtype = np.int16
+            blocksize = 1024
+
+            # PortAudio delivers each block on its own thread; the recorder waits on the
+            # queue instead of blocking the event loop in read() and polling
+            loop = asyncio.get_running_loop()
+            audio_chunks: asyncio.Queue = asyncio.Queue()
+
+            def on_audio(indata, frames, time_info, status):
+                # indata is reused by PortAudio, so hand over a copy
+                loop.call_soon_threadsafe(audio_chunks.put_nowait, indata.tobytes())
 
             # Create audio stream
             stream = sd.InputStream(
                 samplerate=samplerate,
                 channels=channels,
-                dtype=dtype
+                dtype=dtype,
+                blocksize=blocksize,
+                callback=on_audio
             )
 
             stream.start()
@@ -178,16 +200,8 @@ START by introducing yourself and asking about their bankruptcy situation."""
 
             try:
                 while True:
-                    # Read audio chunk
-                    audio_chunk, overflowed = stream.read(1024)
-
-                    # Convert to the format expected by VoicePipeline
-                    if audio_chunk is not None:
-                        # Send audio chunk to the pipeline
-                        await audio_input.add_audio_chunk(audio_chunk.tobytes())
-
-                    # Small delay to prevent busy waiting
-                    await asyncio.sleep(0.01)
+                    # Send each audio chunk to the pipeline as soon as it arrives
+                    await audio_input.add_audio_chunk(await audio_chunks.get())
 
             except asyncio.CancelledError:
                 logger.info("Audio recording stopped")
@@ -229,9 +243,9 @@ class RealtimeVoiceAgent:
             self.is_active = True
         return success
 
-    async def speak(self, text: str) -> bool:
+    async def speak(self, text: str, started: Optional[asyncio.Event] = None) -> bool:
         """Speak text"""
-        return await self.voice_system.speak(text)
+        return await self.voice_system.speak(text, started)
 
     async def listen(self, timeout: Optional[float] = 30.0) -> Optional[str]:
         """Listen for voice input"""
@@ -288,9 +302,9 @@ class SOTA_Voice:
             logger.error(f"Failed to initialize SOTA Voice: {e}")
             return False
 
-    async def speak(self, text: str) -> bool:
+    async def speak(self, text: str, started: Optional[asyncio.Event] = None) -> bool:
         """Speak text"""
-        return await self.voice_system.speak(text)
+        return await self.voice_system.speak(text, started)
 
     async def listen(self, timeout: Optional[float] = None) -> Optional[str]:
         """Listen for voice input"""
@@ -309,8 +323,8 @@ class SOTA_Voice:
         return []
 
     async def interrupt(self):
-        """Interrupt current response (placeholder for compatibility)"""
-        pass
+        """Interrupt current response"""
+        self.voice_system.interrupt()
 
     async def shutdown(self):
         """Shutdown voice system"""
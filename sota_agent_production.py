@@ -8,7 +8,10 @@ import logging
 import random
 import json
 import os
-from typing import List, Dict, Any, Optional, Tuple
+import re
+from collections import deque
+from operator import attrgetter
+from typing import List, Dict, Any, Optional, Tuple, AsyncIterator
 from datetime import datetime, date
 from decimal import Decimal
 from pathlib import Path
@@ -17,7 +20,8 @@ from config import Settings
 from sota_ai import SOTA_AI
 from sota_voice import SOTA_Voice
 from sota_document_processor import SOTADocumentProcessor
-from sota_forms_complete import CompleteBankruptcyCase, FilingType, MaritalStatus
+from sota_forms_complete import CompleteBankruptcyCase, FilingType, MaritalStatus, MonthlyExpenses
+from bankruptcy_field_mapper import BankruptcyFieldMapper, YES_WORDS, NO_WORDS
 from sota_questions import (
     QUESTION_BANK, FOLLOW_UP_QUESTIONS, TRANSITION_PHRASES, EMPATHY_PHRASES,
     QuestionCategory, get_questions_for_category, get_random_question,
@@ -26,6 +30,160 @@ from sota_questions import (
 
 logger = logging.getLogger(__name__)
 
+# Answer vocabularies, matched against whole words of the casefolded answer; the yes/no
+# core is the field mapper's, plus conversational replies to "ready?" and "anything else?"
+_AFFIRMATIVE_WORDS = YES_WORDS | {"ready"}
+_NEGATIVE_WORDS = NO_WORDS | {"nothing", "none"}
+_PAUSE_WORDS = frozenset({"break", "pause"})
+_WORD_RE = re.compile(r"[\w']+")
+
+# Chapter intents - digits may be glued to words ("chapter7"), names must be whole words
+_CHAPTER_7_RE = re.compile(r"(?<!\d)7(?!\d)|\b(?:seven|liquidation)\b", re.IGNORECASE)
+_CHAPTER_13_RE = re.compile(r"(?<!\d)13(?!\d)|\b(?:thirteen|repayment)\b", re.IGNORECASE)
+
+def _answer_words(answer: Optional[str]) -> frozenset:
+    """Split an answer into its set of casefolded words"""
+    return frozenset(_WORD_RE.findall(answer.casefold())) if answer else frozenset()
+
+def _is_affirmative(answer: Optional[str]) -> bool:
+    """Check whether an answer contains a yes-style word"""
+    return not _AFFIRMATIVE_WORDS.isdisjoint(_answer_words(answer))
+
+def _is_negative(answer: Optional[str]) -> bool:
+    """Check whether an answer contains a no-style word"""
+    return not _NEGATIVE_WORDS.isdisjoint(_answer_words(answer))
+
+# Question flow categories in logical order
+_INTERVIEW_CATEGORIES = (
+    QuestionCategory.PERSONAL_INFO,
+    QuestionCategory.INCOME_EMPLOYMENT,
+    QuestionCategory.EXPENSES,
+    QuestionCategory.ASSETS_PROPERTY,
+    QuestionCategory.DEBTS_LIABILITIES,
+    QuestionCategory.LEGAL_HISTORY,
+    QuestionCategory.PREFERENCES
+)
+
+# Filing-type guidance: (voice phrasing, text phrasing). Answer order drives the recommendation.
+_FILING_HELP_QUESTIONS = (
+    ("Do you have a regular income right now?", "Do you have regular income? (yes/no): "),
+    ("Are you behind on your mortgage or car payments?", "Are you behind on mortgage/car payments? (yes/no): "),
+    ("Do you have assets you really want to keep, like a house or car?", "Do you want to keep your house/car? (yes/no): "),
+    ("Are most of your debts credit cards and medical bills?", "Are most debts credit cards/medical bills? (yes/no): ")
+)
+
+# collect_personal_info arguments that map one-to-one onto form fields
+_PERSONAL_INFO_FIELDS = (
+    ("DebtorInfo.ssn_last_4", "ssn"),
+    ("DebtorInfo.address_line_1", "address"),
+    ("DebtorInfo.phone_cell", "phone"),
+    ("DebtorInfo.email", "email"),
+    ("B101.marital_status", "marital_status")
+)
+
+# Spoken expense names that differ from MonthlyExpenses field names
+_EXPENSE_ALIASES = {
+    "rent": "rent_mortgage", "mortgage": "rent_mortgage", "housing": "rent_mortgage",
+    "medical": "healthcare", "car": "transportation", "gas": "transportation",
+    "groceries": "food", "child_care": "childcare", "other": "other_expenses"
+}
+
+# Keyword taxonomies for classifying spoken asset and debt descriptions into B109 categories
+_ASSET_KEYWORD_TAGS = {
+    "real estate": "real", "real property": "real", "house": "real", "home": "real",
+    "land": "real", "condo": "real", "townhouse": "real", "lot": "real"
+}
+_DEBT_KEYWORD_TAGS = {
+    "mortgage": "secured", "heloc": "secured", "car loan": "secured", "auto loan": "secured",
+    "vehicle": "secured", "lien": "secured", "title loan": "secured",
+    "irs": "priority", "tax": "priority", "taxes": "priority", "child support": "priority",
+    "alimony": "priority", "domestic support": "priority"
+}
+
+# Means-test eligibility -> B121 passes_means_test; other outcomes need attorney review
+_MEANS_TEST_OUTCOMES = {"chapter_7_presumed": True, "chapter_13_required": False}
+
+def _compile_keywords(tags: Dict[str, str]) -> "re.Pattern":
+    """Compile a keyword table into one alternation, longest keywords first"""
+    keywords = sorted(tags, key=len, reverse=True)
+    return re.compile(r"\b(?:" + "|".join(map(re.escape, keywords)) + r")\b", re.IGNORECASE)
+
+_ASSET_KEYWORD_RE = _compile_keywords(_ASSET_KEYWORD_TAGS)
+_DEBT_KEYWORD_RE = _compile_keywords(_DEBT_KEYWORD_TAGS)
+
+def _keyword_tag(text: str, pattern: "re.Pattern", tags: Dict[str, str], default: str) -> str:
+    """Classify text in a single scan, returning the tag of the first keyword found"""
+    match = pattern.search(text)
+    return tags[match.group().lower()] if match else default
+
+# Official forms rendered at the end of a consultation, in filing order
+_FORMS_TO_GENERATE = (
+    ("B101", "Official Form B101 - Voluntary Petition"),
+    ("B106", "Official Form B106 - Declaration About Individual Debtor"),
+    ("B107", "Official Form B107 - Statement of Financial Affairs"),
+    ("B121", "Official Form B121 - Statement of Income and Means Test"),
+    ("B122", "Official Form B122 - Statement of Current Monthly Income")
+)
+
+# Case objects addressable by a "<Object>.<field>" key, resolved lazily per answer
+_CASE_OBJECTS = {
+    "DebtorInfo": attrgetter("form_b101.debtor_info"),
+    "SpouseInfo": attrgetter("form_b101.spouse_info"),
+    "B101": attrgetter("form_b101"),
+    "B106": attrgetter("form_b106"),
+    "B107": attrgetter("form_b107"),
+    "B108": attrgetter("form_b108"),
+    "B109": attrgetter("form_b109"),
+    "B121": attrgetter("form_b121"),
+    "B122": attrgetter("form_b122"),
+    "B123": attrgetter("form_b123"),
+    "MonthlyIncome": attrgetter("form_b121.debtor_income"),
+    "MonthlyExpenses": attrgetter("form_b121.monthly_expenses")
+}
+
+# Field-key substrings that decide how an extracted answer is typed, checked in order
+_FIELD_VALUE_KINDS = (
+    ("amount", "decimal"), ("income", "decimal"), ("expense", "decimal"),
+    ("date", "date")
+)
+_BOOLEAN_VALUES = {"true": True, "false": False}
+
+def _field_value_kind(field_key: str) -> Optional[str]:
+    """Kind of value a field holds, from its key, with a single lowered pass"""
+    key = field_key.lower()
+    return next((kind for keyword, kind in _FIELD_VALUE_KINDS if keyword in key), None)
+
+# Static instructions for per-answer extraction; the answer itself goes in the user
+# message so every call shares a byte-identical, cacheable system prefix
+_RESPONSE_EXTRACTION_PROMPT = """
+You are processing a bankruptcy form response.
+
+Extract the appropriate value for the given field. Return ONLY the extracted value in the most appropriate format:
+- For names/text: return the clean text
+- For amounts: return just the number (no $ or commas)
+- For yes/no: return true or false
+- For dates: return YYYY-MM-DD format
+- If unclear or no valid answer: return "UNCLEAR"
+"""
+
+def _to_decimal(value: Any) -> Decimal:
+    """Convert a tool-call number to Decimal, skipping the str() round-trip for ints"""
+    if type(value) is int:
+        return Decimal(value)
+    if type(value) is Decimal:
+        return value
+    # Floats go through their shortest repr so 0.1 stays 0.1
+    return Decimal(str(value))
+
+def _split_full_name(full_name: str) -> Tuple[str, str, str]:
+    """Split a spoken full name into first, middle and last parts"""
+    parts = full_name.split()
+    if not parts:
+        return "", "", ""
+    if len(parts) == 1:
+        return parts[0], "", ""
+    return parts[0], " ".join(parts[1:-1]), parts[-1]
+
 class ConsultationResult:
     def __init__(self, bankruptcy_case: CompleteBankruptcyCase, generated_documents: List[str], consultation_summary: str):
         self.bankruptcy_case = bankruptcy_case
@@ -47,10 +205,13 @@ class SOTABankruptcyAgentProduction:
         self.monitoring = monitoring
         self.security = security
         self.document_processor = SOTADocumentProcessor(settings)
+        self.field_mapper = BankruptcyFieldMapper()
         
         # Initialize complete bankruptcy case
         self.bankruptcy_case = CompleteBankruptcyCase()
-        self.conversation_history = []
+        # Only the most recent exchanges are retained; the total is counted separately
+        self.conversation_history = deque(maxlen=settings.agent.max_conversation_length)
+        self.exchange_count = 0
         self.current_question_category = QuestionCategory.PERSONAL_INFO
         self.asked_questions = set()
         
@@ -58,6 +219,13 @@ class SOTABankruptcyAgentProduction:
         self.conversation_complete = False
         self.session_start_time = datetime.now()
         
+        # PDF generator is built in the background while the interview runs
+        self._pdf_generator_task: Optional[asyncio.Task] = None
+        
+        # Speech in flight is cut off when the client barges in
+        self._speech: Optional[asyncio.Task] = None
+        self.voice.on_interrupt(self._cancel_speech)
+        
         logger.info("Production SOTA Bankruptcy Agent initialized - Full form suite ready")
 
     async def run_complete_consultation(self) -> ConsultationResult:
@@ -66,6 +234,7 @@ class SOTABankruptcyAgentProduction:
         """
         try:
             logger.info("Starting complete production bankruptcy consultation")
+            self._start_pdf_warmup()
             
             # Welcome and setup
             await self._welcome_client()
@@ -79,11 +248,12 @@ class SOTABankruptcyAgentProduction:
             # Complete conversational interview
             await self._conduct_comprehensive_interview()
             
-            # Generate all required documents
-            generated_docs = await self._generate_all_documents()
-            
-            # Create consultation summary
-            summary = await self._generate_consultation_summary()
+            # Generate all required documents and the consultation summary together;
+            # both only read the finished case
+            generated_docs, summary = await asyncio.gather(
+                self._generate_all_documents(),
+                self._generate_consultation_summary()
+            )
             
             # Final review with client
             await self._conduct_final_review()
@@ -116,7 +286,7 @@ class SOTABankruptcyAgentProduction:
         for attempt in range(max_attempts):
             ready = await self._get_user_input("Are you ready to start? Just say yes when you're ready.")
             
-            if ready and ("yes" in ready.lower() or "ready" in ready.lower() or "ok" in ready.lower()):
+            if _is_affirmative(ready):
                 await self.voice.speak("Perfect. Let's begin with some basic information about you.")
                 return
             elif attempt < max_attempts - 1:
@@ -139,10 +309,10 @@ class SOTABankruptcyAgentProduction:
         
         response = await self._get_user_input("Chapter 7, Chapter 13, or help me decide?")
         
-        if "7" in response or "seven" in response.lower() or "liquidation" in response.lower():
+        if _CHAPTER_7_RE.search(response):
             self.bankruptcy_case.filing_type = FilingType.CHAPTER_7
             await self.voice.speak("Got it. We'll prepare your Chapter 7 bankruptcy petition.")
-        elif "13" in response or "thirteen" in response.lower() or "repayment" in response.lower():
+        elif _CHAPTER_13_RE.search(response):
             self.bankruptcy_case.filing_type = FilingType.CHAPTER_13
             await self.voice.speak("Understood. We'll prepare your Chapter 13 repayment plan.")
         else:
@@ -150,24 +320,13 @@ class SOTABankruptcyAgentProduction:
 
     async def _help_determine_filing_type(self):
         """Help client choose filing type based on their situation"""
-        help_questions = [
-            "Do you have a regular income right now?",
-            "Are you behind on your mortgage or car payments?",
-            "Do you have assets you really want to keep, like a house or car?",
-            "Are most of your debts credit cards and medical bills?"
-        ]
-        
         responses = []
-        for question in help_questions:
-            await self.voice.speak(question)
-            response = await self._get_user_input("Please answer yes or no.")
-            responses.append(response.lower())
+        for question, _ in _FILING_HELP_QUESTIONS:
+            response = await self._speak_and_listen(question, "Please answer yes or no.")
+            responses.append(_is_affirmative(response))
         
         # Simple logic to suggest filing type
-        regular_income = "yes" in responses[0]
-        behind_payments = "yes" in responses[1]
-        want_keep_assets = "yes" in responses[2]
-        mostly_unsecured = "yes" in responses[3]
+        regular_income, behind_payments, want_keep_assets, mostly_unsecured = responses
         
         if regular_income and (behind_payments or want_keep_assets):
             suggested_type = FilingType.CHAPTER_13
@@ -179,7 +338,7 @@ class SOTABankruptcyAgentProduction:
         await self.voice.speak(f"{explanation} Would you like to proceed with that recommendation?")
         
         response = await self._get_user_input("Yes or no?")
-        if "yes" in response.lower():
+        if _is_affirmative(response):
             self.bankruptcy_case.filing_type = suggested_type
             await self.voice.speak(f"Perfect. We'll prepare your {suggested_type.value} bankruptcy.")
         else:
@@ -193,32 +352,22 @@ class SOTABankruptcyAgentProduction:
             if uploaded_files:
                 await self.voice.speak(f"I see you've uploaded {len(uploaded_files)} documents. Let me analyze those to help fill out your forms.")
                 
-                for file_path in uploaded_files:
-                    try:
-                        await self.voice.speak(f"Processing {file_path.name}...")
-                        extracted_data = await self.document_processor.process_document(str(file_path), self.bankruptcy_case)
-                        logger.info(f"Processed {file_path.name}: {extracted_data.document_type}")
-                    except Exception as e:
-                        logger.error(f"Failed to process {file_path.name}: {str(e)}")
+                results = await self.document_processor.process_documents(
+                    [str(file_path) for file_path in uploaded_files], self.bankruptcy_case
+                )
+                for file_path, extracted_data in zip(uploaded_files, results):
+                    if isinstance(extracted_data, Exception):
+                        logger.error(f"Failed to process {file_path.name}: {str(extracted_data)}")
                         await self.voice.speak(f"I had trouble reading {file_path.name}, but that's okay. We can gather that information through our conversation.")
+                    else:
+                        logger.info(f"Processed {file_path.name}: {extracted_data.document_type}")
                 
                 await self.voice.speak("Great! I've extracted information from your documents. This will help me fill out your forms more accurately.")
 
     async def _conduct_comprehensive_interview(self):
         """Conduct the complete interview covering all form requirements"""
         
-        # Question flow categories in logical order
-        categories = [
-            QuestionCategory.PERSONAL_INFO,
-            QuestionCategory.INCOME_EMPLOYMENT, 
-            QuestionCategory.EXPENSES,
-            QuestionCategory.ASSETS_PROPERTY,
-            QuestionCategory.DEBTS_LIABILITIES,
-            QuestionCategory.LEGAL_HISTORY,
-            QuestionCategory.PREFERENCES
-        ]
-        
-        for category in categories:
+        for category in _INTERVIEW_CATEGORIES:
             await self._interview_category(category)
             
             # Provide progress update
@@ -240,9 +389,6 @@ class SOTABankruptcyAgentProduction:
                 continue
                 
             await self._ask_and_process_question(field_key, possible_questions)
-            
-            # Add some natural pause
-            await asyncio.sleep(0.5)
 
     async def _ask_and_process_question(self, field_key: str, possible_questions: List[str]):
         """Ask a specific question and process the response"""
@@ -255,8 +401,7 @@ class SOTABankruptcyAgentProduction:
                 # Choose a random question phrasing
                 question = random.choice(possible_questions)
                 
-                await self.voice.speak(question)
-                response = await self._get_user_input("Your answer:")
+                response = await self._speak_and_listen(question, "Your answer:")
                 
                 # Process and validate response
                 processed_value = await self._process_response(field_key, response, question)
@@ -267,7 +412,7 @@ class SOTABankruptcyAgentProduction:
                     self.asked_questions.add(field_key)
                     
                     # Log the conversation
-                    self.conversation_history.append({
+                    self._record_exchange({
                         "question": question,
                         "response": response,
                         "processed_value": str(processed_value),
@@ -293,24 +438,9 @@ class SOTABankruptcyAgentProduction:
         
         try:
             # Use AI to intelligently process the response
-            processing_prompt = f"""
-            You are processing a bankruptcy form response. 
-            
-            Field: {field_key}
-            Question: {original_question}
-            User Response: {response}
-            
-            Extract the appropriate value for this field. Return ONLY the extracted value in the most appropriate format:
-            - For names/text: return the clean text
-            - For amounts: return just the number (no $ or commas)
-            - For yes/no: return true or false
-            - For dates: return YYYY-MM-DD format
-            - If unclear or no valid answer: return "UNCLEAR"
-            """
-            
             ai_response = await self.ai.chat_completion([
-                {"role": "system", "content": processing_prompt},
-                {"role": "user", "content": response}
+                {"role": "system", "content": _RESPONSE_EXTRACTION_PROMPT},
+                {"role": "user", "content": f"Field: {field_key}\nQuestion: {original_question}\nUser Response: {response}"}
             ], temperature=0.1)
             
             extracted_value = ai_response.strip()
@@ -319,20 +449,19 @@ class SOTABankruptcyAgentProduction:
                 return None
                 
             # Type conversion based on field
-            if "amount" in field_key.lower() or "income" in field_key.lower() or "expense" in field_key.lower():
+            value_kind = _field_value_kind(field_key)
+            if value_kind == "decimal":
                 try:
                     return Decimal(extracted_value)
                 except:
                     return None
-            elif "date" in field_key.lower():
+            elif value_kind == "date":
                 try:
                     return datetime.strptime(extracted_value, "%Y-%m-%d").date()
                 except:
                     return None
-            elif extracted_value.lower() in ["true", "false"]:
-                return extracted_value.lower() == "true"
             else:
-                return extracted_value
+                return _BOOLEAN_VALUES.get(extracted_value.lower(), extracted_value)
                 
         except Exception as e:
             logger.error(f"Error in AI response processing: {str(e)}")
@@ -342,72 +471,234 @@ class SOTABankruptcyAgentProduction:
         """Apply processed response to the appropriate field in bankruptcy case"""
         
         try:
-            # Navigate to the correct object and field
-            parts = field_key.split('.')
+            # Navigate to the correct object and field; keys are exactly "<Object>.<field>"
+            obj_name, sep, field_name = field_key.partition('.')
             
-            if len(parts) == 2:
-                obj_name, field_name = parts
-                
+            if sep and '.' not in field_name:
                 # Map to bankruptcy case objects
-                obj_mapping = {
-                    "DebtorInfo": self.bankruptcy_case.form_b101.debtor_info,
-                    "SpouseInfo": self.bankruptcy_case.form_b101.spouse_info,
-                    "B101": self.bankruptcy_case.form_b101,
-                    "B106": self.bankruptcy_case.form_b106,
-                    "B107": self.bankruptcy_case.form_b107,
-                    "B108": self.bankruptcy_case.form_b108,
-                    "B109": self.bankruptcy_case.form_b109,
-                    "B121": self.bankruptcy_case.form_b121,
-                    "B122": self.bankruptcy_case.form_b122,
-                    "B123": self.bankruptcy_case.form_b123,
-                    "MonthlyIncome": self.bankruptcy_case.form_b121.debtor_income,
-                    "MonthlyExpenses": self.bankruptcy_case.form_b121.monthly_expenses
-                }
-                
-                target_obj = obj_mapping.get(obj_name)
+                resolve = _CASE_OBJECTS.get(obj_name)
+                target_obj = resolve(self.bankruptcy_case) if resolve else None
                 if target_obj and hasattr(target_obj, field_name):
                     setattr(target_obj, field_name, value)
+                    self.bankruptcy_case.mark_dirty()
                     logger.info(f"Set {field_key} = {value}")
                     
         except Exception as e:
             logger.error(f"Error applying response to case: {str(e)}")
 
-    async def _generate_all_documents(self) -> List[str]:
-        """Generate all required bankruptcy documents"""
+    def _map_answers(self, answers: Dict[str, str]) -> Dict[str, Any]:
+        """Apply a batch of field answers to the case through the field mapper"""
+        fields_set = []
+        issues = []
+        results = self.field_mapper.map_answers(
+            {field_key: answer for field_key, answer in answers.items() if answer},
+            self.bankruptcy_case
+        )
+        for field_key, (success, message) in results.items():
+            if success:
+                fields_set.append(field_key)
+            else:
+                issues.append(message)
+        
+        return {
+            "status": "partial" if issues else "success",
+            "fields_set": fields_set,
+            "issues": issues
+        }
+
+    async def _process_personal_information(self, arguments: Dict[str, Any]) -> Dict[str, Any]:
+        """Fill debtor, spouse and household fields from one collect_personal_info call"""
+        first, middle, last = _split_full_name(arguments.get("full_name", ""))
+        answers = {
+            "DebtorInfo.first_name": first,
+            "DebtorInfo.middle_name": middle,
+            "DebtorInfo.last_name": last
+        }
+        for field_key, argument in _PERSONAL_INFO_FIELDS:
+            if arguments.get(argument):
+                answers[field_key] = str(arguments[argument])
+        
+        spouse = arguments.get("spouse_info") or {}
+        if spouse.get("full_name"):
+            spouse_first, _, spouse_last = _split_full_name(spouse["full_name"])
+            answers["SpouseInfo.first_name"] = spouse_first
+            answers["SpouseInfo.last_name"] = spouse_last
+        if spouse.get("ssn"):
+            answers["SpouseInfo.ssn_last_4"] = str(spouse["ssn"])
+        
+        dependents = arguments.get("dependents") or []
+        answers["B121.household_size"] = str(1 + bool(spouse) + len(dependents))
+        
+        result = self._map_answers(answers)
+        
+        # Details without a form field are kept for attorney review
+        for key in ("date_of_birth", "dependents", "employment"):
+            if arguments.get(key):
+                self.bankruptcy_case.extracted_data[key] = arguments[key]
+        
+        logger.info(f"Personal information applied: {len(result['fields_set'])} fields")
+        return result
+
+    async def _process_financial_data(self, arguments: Dict[str, Any]) -> Dict[str, Any]:
+        """Fill income, expense, asset and debt totals from one collect_financial_data call"""
+        case = self.bankruptcy_case
+        fields_set = []
+        
+        if arguments.get("monthly_income") is not None:
+            case.form_b121.debtor_income.employment_income = _to_decimal(arguments["monthly_income"])
+            fields_set.append("MonthlyIncome.employment_income")
+        
+        # Totals per expense field for this call, so repeated calls overwrite rather than add up
+        expense_totals: Dict[str, Decimal] = {}
+        for name, amount in (arguments.get("monthly_expenses") or {}).items():
+            field_name = name.casefold().replace(" ", "_")
+            field_name = _EXPENSE_ALIASES.get(field_name, field_name)
+            if field_name not in MonthlyExpenses.model_fields:
+                field_name = "other_expenses"
+            expense_totals[field_name] = expense_totals.get(field_name, Decimal("0")) + _to_decimal(amount)
+        for field_name, total in expense_totals.items():
+            setattr(case.form_b121.monthly_expenses, field_name, total)
+            fields_set.append(f"MonthlyExpenses.{field_name}")
+        
+        assets = arguments.get("assets") or []
+        if assets:
+            real_total = Decimal("0")
+            personal_total = Decimal("0")
+            for asset in assets:
+                value = _to_decimal(asset.get("value", 0))
+                description = f"{asset.get('type', '')} {asset.get('description', '')}"
+                if _keyword_tag(description, _ASSET_KEYWORD_RE, _ASSET_KEYWORD_TAGS, "personal") == "real":
+                    real_total += value
+                else:
+                    personal_total += value
+            case.form_b109.real_property.current_value = real_total
+            case.form_b109.personal_property.current_value = personal_total
+            case.form_b101.estimated_assets = real_total + personal_total
+            fields_set.append("B109.assets")
+        
+        debts = arguments.get("debts") or []
+        if debts:
+            totals = {"secured": Decimal("0"), "priority": Decimal("0"), "nonpriority": Decimal("0")}
+            for debt in debts:
+                description = f"{debt.get('type', '')} {debt.get('creditor', '')}"
+                tag = _keyword_tag(description, _DEBT_KEYWORD_RE, _DEBT_KEYWORD_TAGS, "nonpriority")
+                # An explicit secured flag from the caller wins over the keywords
+                if debt.get("secured"):
+                    tag = "secured"
+                elif debt.get("secured") is False and tag == "secured":
+                    tag = "nonpriority"
+                totals[tag] += _to_decimal(debt.get("balance", 0))
+            case.form_b109.secured_claims.total_amount = totals["secured"]
+            case.form_b109.unsecured_priority_claims.total_amount = totals["priority"]
+            case.form_b109.unsecured_nonpriority_claims.total_amount = totals["nonpriority"]
+            case.form_b101.estimated_liabilities = sum(totals.values(), Decimal("0"))
+            fields_set.append("B109.liabilities")
+        
+        for key in ("income_sources", "assets", "debts", "recent_payments"):
+            if arguments.get(key):
+                case.extracted_data[key] = arguments[key]
+        
+        case.mark_dirty()
+        logger.info(f"Financial data applied: {len(fields_set)} fields")
+        return {"status": "success", "fields_set": fields_set, "issues": []}
+
+    async def _perform_means_test_analysis(self, arguments: Dict[str, Any]) -> Dict[str, Any]:
+        """Run the means test on the case's B121/B122 figures and record the outcome on B121"""
+        case = self.bankruptcy_case
+        means_test = case.form_b121
+        
+        # Figures already on the forms win, so the analysis matches what gets filed;
+        # the tool call's numbers only fill what the interview has not reached yet
+        monthly_income = case.form_b122.average_monthly_income
+        if not monthly_income:
+            monthly_income = means_test.debtor_income.total_monthly_income
+            if means_test.spouse_income is not None:
+                monthly_income += means_test.spouse_income.total_monthly_income
+        if not monthly_income:
+            monthly_income = _to_decimal(arguments.get("total_monthly_income", 0))
+        monthly_expenses = means_test.monthly_expenses.total_monthly_expenses
+        # B121 defaults to a household of one, so the model's count is the better source
+        household_size = arguments.get("household_size") or means_test.household_size
+        state = case.form_b101.debtor_info.state or arguments.get("state", "")
+        
+        b109 = case.form_b109
+        secured_debt = b109.secured_claims.total_amount
+        unsecured_debt = b109.unsecured_priority_claims.total_amount + b109.unsecured_nonpriority_claims.total_amount
+        
+        result = await self.voice.voice_system._perform_means_test_analysis({
+            "client_data": {
+                "state": state,
+                "household_size": household_size,
+                "monthly_income": float(monthly_income),
+                "monthly_expenses": float(monthly_expenses),
+                "total_debt": float(secured_debt + unsecured_debt),
+                "secured_debt": float(secured_debt),
+                "unsecured_debt": float(unsecured_debt)
+            }
+        })
+        
+        outcome = result["analysis"]["means_test"]
+        means_test.household_size = household_size
+        means_test.state_median_income = _to_decimal(outcome["state_median"])
+        means_test.passes_means_test = _MEANS_TEST_OUTCOMES.get(outcome["eligibility"])
+        means_test.disposable_income = monthly_income - monthly_expenses
+        case.mark_dirty()
+        
+        logger.info(f"Means test: {outcome['eligibility']} at {outcome['income_percentage_of_median']}% of median")
+        return result
+
+    @staticmethod
+    def _build_pdf_generator():
+        """Import ReportLab and build the PDF generator (blocking)"""
+        from sota_pdf_generator import SOTAPDFGenerator
+        return SOTAPDFGenerator()
+
+    def _start_pdf_warmup(self):
+        """Start building the PDF generator off-loop so it is ready when documents are due"""
+        if self._pdf_generator_task is None:
+            self._pdf_generator_task = asyncio.create_task(asyncio.to_thread(self._build_pdf_generator))
+
+    async def _get_pdf_generator(self):
+        """Get the warmed-up PDF generator, building it now if warmup never started"""
+        self._start_pdf_warmup()
+        try:
+            return await self._pdf_generator_task
+        except Exception:
+            # Let the next call retry instead of caching the failure
+            self._pdf_generator_task = None
+            raise
+
+    async def _iter_generate_documents(self) -> AsyncIterator[str]:
+        """Generate all required bankruptcy documents, yielding each file as soon as it is written"""
         
         await self.voice.speak("Excellent! Now I'm generating all your bankruptcy documents. This will take just a moment.")
         
+        pdf_generator = await self._get_pdf_generator()
+        generated_count = 0
+        
+        # Generate each required form
+        for form_code, form_name in _FORMS_TO_GENERATE:
+            try:
+                filename = await pdf_generator.generate_form(form_code, self.bankruptcy_case)
+            except Exception as e:
+                logger.error(f"Failed to generate {form_name}: {str(e)}")
+                continue
+            generated_count += 1
+            yield filename
+            await self.voice.speak(f"Generated {form_name}")
+        
+        # Generate summary document
+        summary_file = await pdf_generator.generate_case_summary(self.bankruptcy_case)
+        generated_count += 1
+        yield summary_file
+        
+        await self.voice.speak(f"Perfect! I've generated {generated_count} documents for your bankruptcy case.")
+
+    async def _generate_all_documents(self) -> List[str]:
+        """Generate all required bankruptcy documents"""
+        
         try:
-            # Import document generation
-            from sota_pdf_generator import SOTAPDFGenerator
-            
-            pdf_generator = SOTAPDFGenerator()
-            generated_files = []
-            
-            # Generate each required form
-            forms_to_generate = [
-                ("B101", "Official Form B101 - Voluntary Petition"),
-                ("B106", "Official Form B106 - Declaration About Individual Debtor"),
-                ("B107", "Official Form B107 - Statement of Financial Affairs"),
-                ("B121", "Official Form B121 - Statement of Income and Means Test"),
-                ("B122", "Official Form B122 - Statement of Current Monthly Income")
-            ]
-            
-            for form_code, form_name in forms_to_generate:
-                try:
-                    filename = await pdf_generator.generate_form(form_code, self.bankruptcy_case)
-                    generated_files.append(filename)
-                    await self.voice.speak(f"Generated {form_name}")
-                except Exception as e:
-                    logger.error(f"Failed to generate {form_name}: {str(e)}")
-            
-            # Generate summary document
-            summary_file = await pdf_generator.generate_case_summary(self.bankruptcy_case)
-            generated_files.append(summary_file)
-            
-            await self.voice.speak(f"Perfect! I've generated {len(generated_files)} documents for your bankruptcy case.")
-            
-            return generated_files
+            return [filename async for filename in self._iter_generate_documents()]
             
         except Exception as e:
             logger.error(f"Error generating documents: {str(e)}")
@@ -428,7 +719,7 @@ class SOTABankruptcyAgentProduction:
             Form Completion: {completion_status}
             Ready for Filing: {self.bankruptcy_case.is_ready_for_filing()}
             
-            Conversation History: {len(self.conversation_history)} exchanges
+            Conversation History: {self.exchange_count} exchanges
             Session Duration: {datetime.now() - self.session_start_time}
             
             Include:
@@ -476,27 +767,70 @@ class SOTABankruptcyAgentProduction:
         
         final_questions = await self._get_user_input("Any final questions or additions?")
         
-        if final_questions and "no" not in final_questions.lower():
+        if final_questions and not _is_negative(final_questions):
             await self.voice.speak("Let me make note of that for your attorney.")
             self.bankruptcy_case.extracted_data['final_notes'] = final_questions
         
         await self.voice.speak("Thank you for using DocketVoice. Your bankruptcy paperwork is complete and ready for legal review. Best of luck with your fresh start!")
 
+    async def _speak_and_listen(self, text: str, prompt: str) -> str:
+        """Speak while already listening so the client can barge in"""
+        started = asyncio.Event()
+        speech = self._speech = asyncio.create_task(self.voice.speak(text, started=started))
+        
+        # Open the microphone only once playback has begun (or the speech already ended)
+        started_wait = asyncio.create_task(started.wait())
+        try:
+            await asyncio.wait({speech, started_wait}, return_when=asyncio.FIRST_COMPLETED)
+        except BaseException:
+            speech.cancel()
+            raise
+        finally:
+            started_wait.cancel()
+        
+        try:
+            print(prompt)
+            user_input = await self.voice.listen(timeout=30.0)  # 30 second timeout for VAD voice input
+        except BaseException:
+            await self._stop_speech(speech)
+            raise
+        
+        if user_input:
+            # The answer has started (or finished) - stop talking over it
+            await self._stop_speech(speech)
+            return user_input
+        
+        # Nothing heard - let the question finish before asking again
+        await asyncio.gather(speech, return_exceptions=True)
+        return await self._retry_user_input()
+
+    async def _cancel_speech(self):
+        """Drop the question being spoken; the realtime session already stopped its audio"""
+        if self._speech and not self._speech.done():
+            self._speech.cancel()
+
+    async def _stop_speech(self, speech: asyncio.Task):
+        """Cut off speech that is still playing"""
+        if not speech.done():
+            speech.cancel()
+            await asyncio.gather(speech, return_exceptions=True)
+            await self.voice.interrupt()
+
     async def _get_user_input(self, prompt: str) -> str:
         """Get user input via production voice interface"""
-        # Add a brief pause to allow previous voice response to complete
-        await asyncio.sleep(0.5)
-        
         print(prompt)
         user_input = await self.voice.listen(timeout=30.0)  # 30 second timeout for VAD voice input
         
         if user_input:
             return user_input
-        else:
-            # In production, prompt user to speak again
-            await self.voice.speak("I didn't catch that. Could you please repeat your response?")
-            retry_input = await self.voice.listen(timeout=30.0)  # Longer timeout for VAD retry
-            return retry_input if retry_input else "I'd prefer not to answer that right now"
+        return await self._retry_user_input()
+
+    async def _retry_user_input(self) -> str:
+        """Ask the client to repeat an answer that was not heard"""
+        # In production, prompt user to speak again
+        await self.voice.speak("I didn't catch that. Could you please repeat your response?")
+        retry_input = await self.voice.listen(timeout=30.0)  # Longer timeout for VAD retry
+        return retry_input if retry_input else "I'd prefer not to answer that right now"
 
     async def complete_consultation(self):
         """Public method to run consultation - alias for run_complete_consultation"""
@@ -506,6 +840,7 @@ class SOTABankruptcyAgentProduction:
         """Text-only consultation without voice processing"""
         try:
             logger.info("Starting text-only bankruptcy consultation")
+            self._start_pdf_warmup()
             
             # Text-based welcome
             print("\n" + "="*60)
@@ -516,8 +851,8 @@ class SOTABankruptcyAgentProduction:
             print("a series of questions. This usually takes 45-60 minutes.")
             print("You can type 'break' anytime to pause, or 'help' for assistance.")
             
-            ready = input("\nAre you ready to begin? (yes/no): ").strip().lower()
-            if ready != 'yes' and 'y' not in ready:
+            ready = input("\nAre you ready to begin? (yes/no): ")
+            if not _is_affirmative(ready):
                 print("Take your time. Run the program again when you're ready.")
                 return None
             
@@ -530,11 +865,11 @@ class SOTABankruptcyAgentProduction:
             # Text-based interview
             await self._conduct_text_interview()
             
-            # Generate documents
-            generated_docs = await self._generate_all_documents()
-            
-            # Create summary
-            summary = await self._generate_consultation_summary()
+            # Generate documents and summary together
+            generated_docs, summary = await asyncio.gather(
+                self._generate_all_documents(),
+                self._generate_consultation_summary()
+            )
             
             print(f"\n✅ Consultation completed successfully!")
             print(f"📋 Generated {len(generated_docs)} documents")
@@ -562,11 +897,11 @@ class SOTABankruptcyAgentProduction:
         while True:
             choice = input("Enter filing type (7 or 13), or 'help' for guidance: ").strip()
             
-            if choice == '7' or 'seven' in choice.lower():
+            if _CHAPTER_7_RE.search(choice):
                 self.bankruptcy_case.filing_type = FilingType.CHAPTER_7
                 print("✓ Chapter 7 bankruptcy selected")
                 break
-            elif choice == '13' or 'thirteen' in choice.lower():
+            elif _CHAPTER_13_RE.search(choice):
                 self.bankruptcy_case.filing_type = FilingType.CHAPTER_13  
                 print("✓ Chapter 13 bankruptcy selected")
                 break
@@ -579,17 +914,7 @@ class SOTABankruptcyAgentProduction:
         """Help determine filing type via text questions"""
         print("\nLet me help you choose the right chapter:")
         
-        questions = [
-            "Do you have regular income? (yes/no): ",
-            "Are you behind on mortgage/car payments? (yes/no): ",
-            "Do you want to keep your house/car? (yes/no): ",
-            "Are most debts credit cards/medical bills? (yes/no): "
-        ]
-        
-        answers = []
-        for question in questions:
-            answer = input(question).strip().lower()
-            answers.append('yes' in answer or 'y' == answer)
+        answers = [_is_affirmative(input(question)) for _, question in _FILING_HELP_QUESTIONS]
         
         # Simple logic for recommendation
         if answers[0] and (answers[1] or answers[2]):  # Income + behind/want to keep
@@ -600,7 +925,7 @@ class SOTABankruptcyAgentProduction:
             print("Quick discharge of unsecured debts.")
         
         choice = input("\nFinal choice - Chapter 7 or 13? ").strip()
-        if '7' in choice:
+        if _CHAPTER_7_RE.search(choice):
             self.bankruptcy_case.filing_type = FilingType.CHAPTER_7
         else:
             self.bankruptcy_case.filing_type = FilingType.CHAPTER_13
@@ -638,7 +963,7 @@ class SOTABankruptcyAgentProduction:
             print(f"\nQ{i+1}: {question}")
             answer = input("Your answer: ").strip()
             
-            if answer.lower() in ['break', 'pause']:
+            if answer.casefold() in _PAUSE_WORDS:
                 print("Taking a break... type anything to continue")
                 input()
                 continue
@@ -652,13 +977,18 @@ class SOTABankruptcyAgentProduction:
                 self.asked_questions.add(question)
                 
                 # Store in conversation history
-                self.conversation_history.append({
+                self._record_exchange({
                     'question': question,
                     'answer': answer,
                     'category': category.value,
                     'timestamp': datetime.now().isoformat()
                 })
 
+    def _record_exchange(self, entry: Dict[str, Any]):
+        """Append to the bounded conversation history and count the exchange"""
+        self.conversation_history.append(entry)
+        self.exchange_count += 1
+
     async def shutdown(self):
         """Cleanup resources"""
         logger.info("Production SOTA Bankruptcy Agent shutting down")
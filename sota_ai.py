@@ -62,11 +62,16 @@ class SOTA_AI:
                     else:
                         user_messages.append(msg)
                 
+                # Mark the static system prompt cacheable so repeat calls reuse its prefix
+                system = [
+                    {"type": "text", "text": system_message, "cache_control": {"type": "ephemeral"}}
+                ] if system_message else system_message
+                
                 response = await self.anthropic_client.messages.create(
                     model=model or self.settings.ai.anthropic_model,
                     max_tokens=4000,
                     temperature=temperature,
-                    system=system_message,
+                    system=system,
                     messages=user_messages
                 )
                 return response.content[0].text
@@ -4,11 +4,16 @@ Production-ready document processing for bankruptcy forms
 """
 
 import asyncio
+import functools
+import hashlib
 import logging
 import os
 import io
 import re
 import json
+import time
+import base64
+from uuid import uuid4
 from typing import List, Dict, Any, Optional, Tuple, Union
 from datetime import datetime, date
 from decimal import Decimal
@@ -25,6 +30,26 @@ import pandas as pd
 from dateutil import parser
 import aiofiles
 
+# Fast JSON for model output and the analysis cache
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import tiktoken
+    TIKTOKEN_AVAILABLE = True
+except ImportError:
+    TIKTOKEN_AVAILABLE = False
+
+# Encryption for the analysis cache when security.data_encryption_enabled is set
+try:
+    from cryptography.fernet import Fernet
+    CRYPTOGRAPHY_AVAILABLE = True
+except ImportError:
+    CRYPTOGRAPHY_AVAILABLE = False
+
 from config import Settings
 from sota_forms_complete import CompleteBankruptcyCase, DebtorInfo, MonthlyIncome, MonthlyExpenses
 
@@ -53,6 +78,160 @@ class ExtractedData:
         self.extracted_names: List[str] = []
         self.extracted_addresses: List[str] = []
 
+def _json_dumps_bytes(obj: Any) -> bytes:
+    """Serialize to UTF-8 JSON bytes, stringifying Decimals/dates; orjson when installed"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, default=str, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, default=str).encode('utf-8')
+
+def _json_loads(data) -> Any:
+    """Parse a JSON string or bytes, using orjson when installed"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+# Model used for structured extraction; part of the analysis cache key
+_EXTRACTION_MODEL = "gpt-4o"
+_AI_CONFIDENCE = 0.9  # Confidence assigned to model extractions
+_ANALYSIS_CACHE_VERSION = b"2"  # Bump when prompts or the cached layout change
+
+# Token budget for the document text sent to the extraction model
+_MAX_EXTRACTION_TOKENS = 6000
+_CHARS_PER_TOKEN = 4  # Rough English average, used when tiktoken is unavailable
+
+@functools.lru_cache(maxsize=None)
+def _extraction_encoding():
+    """Tokenizer for the extraction model, or None if it can't be loaded; built once either way"""
+    if not TIKTOKEN_AVAILABLE:
+        return None
+    try:
+        # The first load downloads the BPE file, which fails offline or behind a proxy
+        return tiktoken.encoding_for_model(_EXTRACTION_MODEL)
+    except Exception as e:
+        logger.warning(f"Tokenizer unavailable, using a character budget: {str(e)}")
+        return None
+
+def _truncate_to_token_budget(text: str, max_tokens: int = _MAX_EXTRACTION_TOKENS) -> str:
+    """Cut text to at most max_tokens model tokens, on a token boundary"""
+    encoding = _extraction_encoding()
+    if encoding is not None:
+        tokens = encoding.encode(text, disallowed_special=())
+        if len(tokens) <= max_tokens:
+            return text
+        return encoding.decode(tokens[:max_tokens])
+    return text[:max_tokens * _CHARS_PER_TOKEN]
+
+# Image formats routed to OCR; PIL decodes all of these
+_IMAGE_EXTENSIONS = frozenset({'.jpg', '.jpeg', '.png', '.tiff', '.tif', '.bmp', '.webp', '.gif'})
+
+# Fallback extraction patterns, compiled once
+_AMOUNT_RE = re.compile(r'\$[\d,]+\.?\d*')
+_DATE_RES = (
+    re.compile(r'\d{1,2}/\d{1,2}/\d{4}'),
+    re.compile(r'\d{1,2}-\d{1,2}-\d{4}'),
+    re.compile(r'\d{4}-\d{1,2}-\d{1,2}'),
+    re.compile(r'[A-Za-z]+ \d{1,2}, \d{4}')
+)
+_NAME_RE = re.compile(r'\b[A-Z][a-z]+ [A-Z][a-z]+\b')  # Simple pattern for names (capitalized words)
+_ADDRESS_RE = re.compile(
+    r'\d+\s+[A-Za-z0-9\s,]+(?:Street|St|Avenue|Ave|Road|Rd|Boulevard|Blvd|Lane|Ln|Drive|Dr|Court|Ct|Place|Pl)[A-Za-z0-9\s,]*\d{5}(?:-\d{4})?',
+    re.IGNORECASE
+)
+
+# Extraction prompts are static per document type, so they are built once at import
+_EXTRACTION_BASE_PROMPT = """You are an expert document analyzer specializing in bankruptcy case preparation. 
+        Extract structured data from the provided document text. Return ONLY valid JSON.
+        
+        Always include these base fields:
+        - "document_type": the type of document
+        - "amounts": array of monetary amounts found
+        - "dates": array of dates found (YYYY-MM-DD format)
+        - "names": array of person/entity names found
+        - "addresses": array of addresses found
+        """
+
+_EXTRACTION_PROMPTS = {
+    DocumentType.BANK_STATEMENT: _EXTRACTION_BASE_PROMPT + """
+    For bank statements, also extract:
+    - "account_number": masked account number
+    - "account_type": checking, savings, etc.
+    - "beginning_balance": starting balance amount
+    - "ending_balance": final balance amount
+    - "total_deposits": sum of all deposits
+    - "total_withdrawals": sum of all withdrawals
+    - "monthly_average_balance": average balance if calculable
+    """,
+    
+    DocumentType.PAY_STUB: _EXTRACTION_BASE_PROMPT + """
+    For pay stubs, also extract:
+    - "employer_name": name of employer
+    - "employee_name": name of employee
+    - "pay_period_start": start date of pay period
+    - "pay_period_end": end date of pay period
+    - "gross_pay": gross pay amount
+    - "net_pay": net pay amount
+    - "ytd_gross": year-to-date gross
+    - "ytd_net": year-to-date net
+    - "federal_withholding": federal tax withheld
+    - "state_withholding": state tax withheld
+    """,
+    
+    DocumentType.TAX_RETURN: _EXTRACTION_BASE_PROMPT + """
+    For tax returns, also extract:
+    - "tax_year": year of the tax return
+    - "filing_status": single, married, etc.
+    - "adjusted_gross_income": AGI amount
+    - "taxable_income": taxable income amount
+    - "total_tax": total tax owed
+    - "wages_salary": W-2 wages
+    - "interest_income": interest earned
+    - "business_income": business income/loss
+    """
+}
+
+# Appended to the type prompt when several documents share one extraction call
+_BATCH_EXTRACTION_SUFFIX = """
+    You will receive several numbered documents of this type. Return a JSON object with a
+    "documents" array holding one extraction per document, each with the fields above plus
+    "document_index": the number of the document it was extracted from.
+    """
+
+_BATCH_RESPONSE_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "document_extractions",
+        "schema": {
+            "type": "object",
+            "properties": {
+                "documents": {
+                    "type": "array",
+                    "items": {
+                        "type": "object",
+                        "properties": {"document_index": {"type": "integer"}},
+                        "required": ["document_index"]
+                    }
+                }
+            },
+            "required": ["documents"]
+        }
+    }
+}
+
+# Static summary instructions; only the document list varies per call, so it goes in
+# the user message and the system prefix stays identical for prompt caching
+_DOCUMENT_SUMMARY_PROMPT = """
+Generate a comprehensive summary of the documents processed for this bankruptcy case.
+
+Include:
+1. Document types identified
+2. Key financial data extracted
+3. Completeness of information
+4. Any missing documents typically needed
+5. Recommendations for additional documentation
+
+Format as a professional attorney-ready summary.
+"""
+
 class SOTADocumentProcessor:
     def __init__(self, settings: Settings):
         self.settings = settings
@@ -62,6 +241,24 @@ class SOTADocumentProcessor:
         # OCR Configuration
         self.tesseract_config = r'--oem 3 --psm 6'
         
+        self.extraction_batch_size = max(1, settings.documents.extraction_batch_size)
+        
+        # Type-specific appliers for extracted data, one lookup per document
+        self._type_appliers = {
+            DocumentType.PAY_STUB: self._apply_paystub_data,
+            DocumentType.BANK_STATEMENT: self._apply_bank_statement_data,
+            DocumentType.TAX_RETURN: self._apply_tax_return_data,
+            DocumentType.CREDIT_REPORT: self._apply_credit_report_data
+        }
+        
+        # Opt-in persistent cache of analyses keyed by file content hash
+        self.analysis_cache_dir = None
+        self.analysis_cache_ttl = settings.documents.analysis_cache_ttl_seconds
+        self._analysis_cipher = None
+        cache_dir = settings.documents.analysis_cache_dir
+        if cache_dir:
+            self._init_analysis_cache(Path(cache_dir), settings)
+        
         # Document Classification Patterns
         self.document_patterns = {
             DocumentType.BANK_STATEMENT: [
@@ -82,6 +279,16 @@ class SOTADocumentProcessor:
             ]
         }
         
+        # All classification patterns as one alternation, one named group per pattern,
+        # so a document is scanned once instead of once per pattern
+        self._pattern_doc_types = []
+        alternatives = []
+        for doc_type, patterns in self.document_patterns.items():
+            for pattern in patterns:
+                alternatives.append(f"(?P<p{len(self._pattern_doc_types)}>{pattern})")
+                self._pattern_doc_types.append(doc_type)
+        self._document_pattern_re = re.compile("|".join(alternatives))
+        
         logger.info("SOTA Document Processor initialized with OCR and AI analysis")
 
     async def process_document(self, file_path: str, bankruptcy_case: CompleteBankruptcyCase) -> ExtractedData:
@@ -89,26 +296,10 @@ class SOTADocumentProcessor:
         Main document processing pipeline
         """
         try:
-            logger.info(f"Processing document: {file_path}")
-            
-            # Step 1: Extract text using OCR
-            extracted_text = await self._extract_text_from_document(file_path)
-            
-            # Step 2: Classify document type
-            document_type = self._classify_document(extracted_text)
-            
-            # Step 3: Extract structured data using AI
-            structured_data = await self._extract_structured_data(extracted_text, document_type)
+            result = await self._analyze_document(file_path)
             
             # Step 4: Apply extracted data to bankruptcy case
-            await self._apply_extracted_data_to_case(structured_data, document_type, bankruptcy_case)
-            
-            # Step 5: Create extraction result
-            result = ExtractedData()
-            result.text_content = extracted_text
-            result.structured_data = structured_data
-            result.document_type = document_type
-            result.confidence_score = structured_data.get('confidence_score', 0.8)
+            await self._apply_extracted_data_to_case(result.structured_data, result.document_type, bankruptcy_case)
             
             logger.info(f"Document processing completed for {file_path}")
             return result
@@ -117,95 +308,282 @@ class SOTADocumentProcessor:
             logger.error(f"Error processing document {file_path}: {str(e)}")
             raise
 
-    async def _extract_text_from_document(self, file_path: str) -> str:
+    async def process_documents(self, file_paths: List[str], bankruptcy_case: CompleteBankruptcyCase) -> List[Union[ExtractedData, Exception]]:
+        """
+        Process several documents, overlapping their OCR and AI round-trips
+        
+        Documents of the same type share extraction calls, up to
+        extraction_batch_size per call. Results are applied to the case one at a
+        time in input order; a failed document yields its exception in place of
+        an ExtractedData.
+        """
+        prepared = await asyncio.gather(
+            *(self._prepare_document(file_path) for file_path in file_paths),
+            return_exceptions=True
+        )
+        
+        results: List[Union[ExtractedData, Exception]] = list(prepared)
+        pending: Dict[str, List[int]] = {}
+        for index, item in enumerate(prepared):
+            if isinstance(item, Exception):
+                continue
+            _, cached, _, document_type = item
+            if cached is not None:
+                logger.info(f"Reusing cached analysis for {file_paths[index]}")
+                results[index] = cached
+            else:
+                pending.setdefault(document_type, []).append(index)
+        
+        batches = [
+            (document_type, indices[start:start + self.extraction_batch_size])
+            for document_type, indices in pending.items()
+            for start in range(0, len(indices), self.extraction_batch_size)
+        ]
+        extractions = await asyncio.gather(
+            *(self._extract_structured_data_batch([prepared[i][2] for i in batch], document_type)
+              for document_type, batch in batches),
+            return_exceptions=True
+        )
+        for (document_type, batch), structured_batch in zip(batches, extractions):
+            if isinstance(structured_batch, Exception):
+                for index in batch:
+                    results[index] = structured_batch
+                continue
+            for index, structured_data in zip(batch, structured_batch):
+                cache_path, _, extracted_text, _ = prepared[index]
+                results[index] = await self._finish_analysis(cache_path, extracted_text, document_type, structured_data)
+        
+        for file_path, result in zip(file_paths, results):
+            if isinstance(result, Exception):
+                logger.error(f"Error processing document {file_path}: {str(result)}")
+                continue
+            await self._apply_extracted_data_to_case(result.structured_data, result.document_type, bankruptcy_case)
+            logger.info(f"Document processing completed for {file_path}")
+        
+        return results
+
+    async def _analyze_document(self, file_path: str) -> ExtractedData:
+        """
+        Extract, classify and structure one document without touching the case
+        """
+        cache_path, cached, extracted_text, document_type = await self._prepare_document(file_path)
+        if cached is not None:
+            logger.info(f"Reusing cached analysis for {file_path}")
+            return cached
+        
+        # Step 3: Extract structured data using AI
+        structured_data = await self._extract_structured_data(extracted_text, document_type)
+        return await self._finish_analysis(cache_path, extracted_text, document_type, structured_data)
+
+    async def _prepare_document(self, file_path: str) -> Tuple[Optional[Path], Optional[ExtractedData], str, str]:
+        """
+        Read a document and return (cache path, cached analysis, text, type)
+        
+        Text and type are empty when a cached analysis is found.
+        """
+        logger.info(f"Processing document: {file_path}")
+        
+        file_bytes = await self._read_file_bytes(file_path)
+        cache_path = self._analysis_cache_path(file_bytes)
+        cached = await self._load_cached_analysis(cache_path)
+        if cached is not None:
+            return cache_path, cached, "", ""
+        
+        # Step 1: Extract text using OCR
+        extracted_text = await self._extract_text_from_document(file_path, file_bytes)
+        
+        # Step 2: Classify document type
+        document_type = self._classify_document(extracted_text)
+        return cache_path, None, extracted_text, document_type
+
+    async def _finish_analysis(self, cache_path: Optional[Path], extracted_text: str, document_type: str, structured_data: Dict[str, Any]) -> ExtractedData:
+        """
+        Build the extraction result and cache it if it came from the model
+        """
+        # Step 5: Create extraction result
+        result = ExtractedData()
+        result.text_content = extracted_text
+        result.structured_data = structured_data
+        result.document_type = document_type
+        result.confidence_score = structured_data.get('confidence_score', 0.8)
+        
+        # Only model extractions are cached; pattern fallbacks should be retried
+        if result.confidence_score >= _AI_CONFIDENCE:
+            await self._store_cached_analysis(cache_path, result)
+        return result
+
+    def _init_analysis_cache(self, cache_dir: Path, settings: Settings):
+        """Enable the analysis cache, encrypted whenever data encryption is required"""
+        if settings.security.data_encryption_enabled:
+            key = settings.security.encryption_key
+            if not (CRYPTOGRAPHY_AVAILABLE and key):
+                logger.warning("Analysis cache disabled: data encryption is enabled but no encryption key or cryptography package is available")
+                return
+            # Any passphrase works: it is stretched to the 32-byte key Fernet expects
+            fernet_key = base64.urlsafe_b64encode(hashlib.sha256(key.get_secret_value().encode()).digest())
+            self._analysis_cipher = Fernet(fernet_key)
+        
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        self.analysis_cache_dir = cache_dir
+        
+        # Sweep entries that expired while the process was down
+        cutoff = time.time() - self.analysis_cache_ttl
+        for entry in cache_dir.iterdir():
+            try:
+                if entry.stat().st_mtime < cutoff:
+                    entry.unlink(missing_ok=True)
+            except FileNotFoundError:
+                continue
+
+    def _analysis_cache_path(self, file_bytes: bytes) -> Optional[Path]:
+        """Cache file for a document's analysis, keyed by content, model and cache version"""
+        if not self.analysis_cache_dir:
+            return None
+        digest = hashlib.blake2b(file_bytes, digest_size=20)
+        digest.update(_EXTRACTION_MODEL.encode())
+        digest.update(_ANALYSIS_CACHE_VERSION)
+        return self.analysis_cache_dir / f"{digest.hexdigest()}.cache"
+
+    async def _load_cached_analysis(self, cache_path: Optional[Path]) -> Optional[ExtractedData]:
+        """Load a previously stored analysis, or None on a miss or unreadable entry"""
+        if cache_path is None:
+            return None
+        try:
+            if time.time() - cache_path.stat().st_mtime > self.analysis_cache_ttl:
+                cache_path.unlink(missing_ok=True)
+                return None
+            async with aiofiles.open(cache_path, 'rb') as f:
+                payload = await f.read()
+            if self._analysis_cipher is not None:
+                payload = self._analysis_cipher.decrypt(payload)
+            cached = _json_loads(payload)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable analysis cache entry {cache_path}: {str(e)}")
+            return None
+        
+        # The OCR text is not cached; only the extraction the case needs is kept
+        result = ExtractedData()
+        result.structured_data = cached['structured_data']
+        result.document_type = cached['document_type']
+        result.confidence_score = cached['confidence_score']
+        return result
+
+    async def _store_cached_analysis(self, cache_path: Optional[Path], result: ExtractedData):
+        """Persist an analysis atomically so concurrent readers never see a partial file"""
+        if cache_path is None:
+            return
+        payload = _json_dumps_bytes({
+            'structured_data': result.structured_data,
+            'document_type': result.document_type,
+            'confidence_score': result.confidence_score
+        })
+        if self._analysis_cipher is not None:
+            payload = self._analysis_cipher.encrypt(payload)
+        # Unique per writer, so concurrent stores of the same document never share a temp file
+        tmp_path = cache_path.with_name(f".{uuid4().hex}.part")
+        try:
+            async with aiofiles.open(tmp_path, 'wb') as f:
+                await f.write(payload)
+            os.replace(tmp_path, cache_path)
+        except Exception as e:
+            tmp_path.unlink(missing_ok=True)
+            logger.warning(f"Could not write analysis cache entry {cache_path}: {str(e)}")
+
+    async def _extract_text_from_document(self, file_path: str, file_bytes: bytes) -> str:
         """
         Extract text from PDF or image using OCR
         """
         file_ext = Path(file_path).suffix.lower()
         
         if file_ext == '.pdf':
-            return await self._extract_text_from_pdf(file_path)
-        elif file_ext in ['.jpg', '.jpeg', '.png', '.tiff', '.bmp']:
-            return await self._extract_text_from_image(file_path)
+            return await self._extract_text_from_pdf(file_path, file_bytes)
+        elif file_ext in _IMAGE_EXTENSIONS:
+            return await self._extract_text_from_image(file_bytes)
         else:
             raise ValueError(f"Unsupported file type: {file_ext}")
 
-    async def _extract_text_from_pdf(self, file_path: str) -> str:
+    async def _extract_text_from_pdf(self, file_path: str, pdf_bytes: bytes) -> str:
         """
         Extract text from PDF using PyMuPDF and OCR fallback
         """
-        text_content = ""
-        
+        # Both the text layer and the OCR fallback parse the same in-memory bytes
         try:
             # First try to extract text directly from PDF
-            doc = fitz.open(file_path)
-            for page_num in range(len(doc)):
-                page = doc.load_page(page_num)
-                text = page.get_text()
-                text_content += text + "\n"
-            doc.close()
+            text_content = await asyncio.to_thread(self._read_pdf_text, pdf_bytes)
             
             # If no text extracted, use OCR
             if len(text_content.strip()) < 100:
                 logger.info(f"PDF text extraction yielded minimal content, using OCR for {file_path}")
-                text_content = await self._ocr_pdf_pages(file_path)
+                text_content = await self._ocr_pdf_pages(pdf_bytes)
                 
         except Exception as e:
             logger.warning(f"Error in PDF text extraction: {str(e)}, falling back to OCR")
-            text_content = await self._ocr_pdf_pages(file_path)
+            text_content = await self._ocr_pdf_pages(pdf_bytes)
         
         return text_content
 
-    async def _ocr_pdf_pages(self, file_path: str) -> str:
+    @staticmethod
+    async def _read_file_bytes(file_path: str) -> bytes:
+        """Read a document without blocking the event loop"""
+        async with aiofiles.open(file_path, 'rb') as f:
+            return await f.read()
+
+    @staticmethod
+    def _read_pdf_text(pdf_bytes: bytes) -> str:
+        """Read the embedded text layer of a PDF (blocking)"""
+        with fitz.open(stream=pdf_bytes, filetype="pdf") as doc:
+            # Pages are consumed lazily and joined once instead of re-copying the growing text
+            return "".join(page.get_text() + "\n" for page in doc)
+
+    async def _ocr_pdf_pages(self, pdf_bytes: bytes) -> str:
         """
         OCR all pages of a PDF
         """
-        text_content = ""
+        return await asyncio.to_thread(self._ocr_pdf_pages_sync, pdf_bytes)
+
+    def _ocr_pdf_pages_sync(self, pdf_bytes: bytes) -> str:
+        """Render and OCR every PDF page (blocking)"""
+        with fitz.open(stream=pdf_bytes, filetype="pdf") as doc:
+            return "".join(self._ocr_pdf_page(page) for page in doc)
+
+    def _ocr_pdf_page(self, page) -> str:
+        """Render and OCR a single PDF page (blocking)"""
+        # Convert page to image
+        mat = fitz.Matrix(2.0, 2.0)  # 2x zoom for better OCR
+        pix = page.get_pixmap(matrix=mat, colorspace=fitz.csRGB, alpha=False)
         
-        doc = fitz.open(file_path)
-        for page_num in range(len(doc)):
-            page = doc.load_page(page_num)
-            
-            # Convert page to image
-            mat = fitz.Matrix(2.0, 2.0)  # 2x zoom for better OCR
-            pix = page.get_pixmap(matrix=mat)
-            img_data = pix.tobytes("png")
-            
-            # Convert to PIL Image
-            image = Image.open(io.BytesIO(img_data))
-            
-            # Preprocess image for better OCR
-            processed_image = self._preprocess_image_for_ocr(image)
-            
-            # OCR the image
-            page_text = pytesseract.image_to_string(processed_image, config=self.tesseract_config)
-            text_content += page_text + "\n"
+        # Wrap the raw RGB samples directly - no PNG encode/decode round-trip
+        image = Image.frombytes("RGB", (pix.width, pix.height), pix.samples)
         
-        doc.close()
-        return text_content
+        # Preprocess and OCR the image
+        return self._ocr_image(image) + "\n"
 
-    async def _extract_text_from_image(self, file_path: str) -> str:
+    async def _extract_text_from_image(self, image_bytes: bytes) -> str:
         """
         Extract text from image using OCR
         """
         try:
-            image = Image.open(file_path)
-            processed_image = self._preprocess_image_for_ocr(image)
-            text = pytesseract.image_to_string(processed_image, config=self.tesseract_config)
-            return text
+            image = Image.open(io.BytesIO(image_bytes))
+            return await asyncio.to_thread(self._ocr_image, image)
         except Exception as e:
             logger.error(f"Error in image OCR: {str(e)}")
             raise
 
+    def _ocr_image(self, image: Image.Image) -> str:
+        """Preprocess an image and run Tesseract on it (blocking)"""
+        processed_image = self._preprocess_image_for_ocr(image)
+        return pytesseract.image_to_string(processed_image, config=self.tesseract_config)
+
     def _preprocess_image_for_ocr(self, image: Image.Image) -> Image.Image:
         """
         Preprocess image to improve OCR accuracy
         """
-        # Convert PIL to OpenCV
-        opencv_image = cv2.cvtColor(np.array(image), cv2.COLOR_RGB2BGR)
-        
-        # Convert to grayscale
-        gray = cv2.cvtColor(opencv_image, cv2.COLOR_BGR2GRAY)
+        # Convert PIL straight to OpenCV grayscale - no intermediate BGR copy
+        if image.mode != "RGB":
+            image = image.convert("RGB")
+        gray = cv2.cvtColor(np.asarray(image), cv2.COLOR_RGB2GRAY)
         
         # Apply Gaussian blur to reduce noise
         blurred = cv2.GaussianBlur(gray, (5, 5), 0)
@@ -213,12 +591,8 @@ class SOTADocumentProcessor:
         # Apply adaptive thresholding
         thresh = cv2.adaptiveThreshold(blurred, 255, cv2.ADAPTIVE_THRESH_GAUSSIAN_C, cv2.THRESH_BINARY, 11, 2)
         
-        # Morphological operations to clean up
-        kernel = np.ones((1, 1), np.uint8)
-        processed = cv2.morphologyEx(thresh, cv2.MORPH_CLOSE, kernel)
-        
         # Convert back to PIL
-        processed_image = Image.fromarray(processed)
+        processed_image = Image.fromarray(thresh)
         return processed_image
 
     def _classify_document(self, text: str) -> str:
@@ -226,11 +600,12 @@ class SOTADocumentProcessor:
         Classify document type based on content patterns
         """
         text_lower = text.lower()
-        scores = {}
+        scores = dict.fromkeys(self.document_patterns, 0)
         
-        for doc_type, patterns in self.document_patterns.items():
-            score = sum(1 for pattern in patterns if re.search(pattern, text_lower))
-            scores[doc_type] = score
+        # Each pattern counts once, however often it appears
+        matched = {int(m.lastgroup[1:]) for m in self._document_pattern_re.finditer(text_lower)}
+        for index in matched:
+            scores[self._pattern_doc_types[index]] += 1
         
         if scores:
             best_type = max(scores, key=scores.get)
@@ -249,7 +624,7 @@ class SOTADocumentProcessor:
             
             # Use OpenAI for structured extraction
             response = await self.openai_client.chat.completions.create(
-                model="gpt-4o",
+                model=_EXTRACTION_MODEL,
                 messages=[
                     {
                         "role": "system", 
@@ -257,15 +632,15 @@ class SOTADocumentProcessor:
                     },
                     {
                         "role": "user", 
-                        "content": f"Extract structured data from this document:\n\n{text}"
+                        "content": f"Extract structured data from this document:\n\n{_truncate_to_token_budget(text)}"
                     }
                 ],
                 temperature=0.1,
                 response_format={"type": "json_object"}
             )
             
-            extracted_data = json.loads(response.choices[0].message.content)
-            extracted_data['confidence_score'] = 0.9  # High confidence for GPT-4o
+            extracted_data = _json_loads(response.choices[0].message.content)
+            extracted_data['confidence_score'] = _AI_CONFIDENCE  # High confidence for GPT-4o
             
             return extracted_data
             
@@ -274,61 +649,57 @@ class SOTADocumentProcessor:
             # Fallback to pattern-based extraction
             return self._pattern_based_extraction(text, document_type)
 
-    def _get_extraction_prompt(self, document_type: str) -> str:
+    async def _extract_structured_data_batch(self, texts: List[str], document_type: str) -> List[Dict[str, Any]]:
         """
-        Get AI extraction prompt based on document type
-        """
-        base_prompt = """You are an expert document analyzer specializing in bankruptcy case preparation. 
-        Extract structured data from the provided document text. Return ONLY valid JSON.
+        Extract structured data from several same-type documents in one AI call
         
-        Always include these base fields:
-        - "document_type": the type of document
-        - "amounts": array of monetary amounts found
-        - "dates": array of dates found (YYYY-MM-DD format)
-        - "names": array of person/entity names found
-        - "addresses": array of addresses found
+        Falls back to one call per document if the batched response cannot be
+        matched back to its inputs.
         """
+        if len(texts) == 1:
+            return [await self._extract_structured_data(texts[0], document_type)]
         
-        type_specific_prompts = {
-            DocumentType.BANK_STATEMENT: base_prompt + """
-            For bank statements, also extract:
-            - "account_number": masked account number
-            - "account_type": checking, savings, etc.
-            - "beginning_balance": starting balance amount
-            - "ending_balance": final balance amount
-            - "total_deposits": sum of all deposits
-            - "total_withdrawals": sum of all withdrawals
-            - "monthly_average_balance": average balance if calculable
-            """,
+        try:
+            documents = "\n\n".join(
+                f"--- Document {number} ---\n{_truncate_to_token_budget(text)}"
+                for number, text in enumerate(texts, 1)
+            )
+            response = await self.openai_client.chat.completions.create(
+                model=_EXTRACTION_MODEL,
+                messages=[
+                    {
+                        "role": "system",
+                        "content": self._get_extraction_prompt(document_type) + _BATCH_EXTRACTION_SUFFIX
+                    },
+                    {
+                        "role": "user",
+                        "content": f"Extract structured data from each of these {len(texts)} documents:\n\n{documents}"
+                    }
+                ],
+                temperature=0.1,
+                response_format=_BATCH_RESPONSE_FORMAT
+            )
             
-            DocumentType.PAY_STUB: base_prompt + """
-            For pay stubs, also extract:
-            - "employer_name": name of employer
-            - "employee_name": name of employee
-            - "pay_period_start": start date of pay period
-            - "pay_period_end": end date of pay period
-            - "gross_pay": gross pay amount
-            - "net_pay": net pay amount
-            - "ytd_gross": year-to-date gross
-            - "ytd_net": year-to-date net
-            - "federal_withholding": federal tax withheld
-            - "state_withholding": state tax withheld
-            """,
+            by_index = {}
+            for item in _json_loads(response.choices[0].message.content)['documents']:
+                item['confidence_score'] = _AI_CONFIDENCE
+                by_index[item.pop('document_index')] = item
+            if sorted(by_index) != list(range(1, len(texts) + 1)):
+                raise ValueError(f"expected results for documents 1-{len(texts)}, got {sorted(by_index)}")
             
-            DocumentType.TAX_RETURN: base_prompt + """
-            For tax returns, also extract:
-            - "tax_year": year of the tax return
-            - "filing_status": single, married, etc.
-            - "adjusted_gross_income": AGI amount
-            - "taxable_income": taxable income amount
-            - "total_tax": total tax owed
-            - "wages_salary": W-2 wages
-            - "interest_income": interest earned
-            - "business_income": business income/loss
-            """
-        }
-        
-        return type_specific_prompts.get(document_type, base_prompt)
+            return [by_index[number] for number in range(1, len(texts) + 1)]
+            
+        except Exception as e:
+            logger.error(f"Error in batched AI extraction, extracting individually: {str(e)}")
+            return await asyncio.gather(
+                *(self._extract_structured_data(text, document_type) for text in texts)
+            )
+
+    def _get_extraction_prompt(self, document_type: str) -> str:
+        """
+        Get AI extraction prompt based on document type
+        """
+        return _EXTRACTION_PROMPTS.get(document_type, _EXTRACTION_BASE_PROMPT)
 
     def _pattern_based_extraction(self, text: str, document_type: str) -> Dict[str, Any]:
         """
@@ -347,8 +718,7 @@ class SOTADocumentProcessor:
 
     def _extract_amounts(self, text: str) -> List[float]:
         """Extract monetary amounts from text"""
-        pattern = r'\$[\d,]+\.?\d*'
-        matches = re.findall(pattern, text)
+        matches = _AMOUNT_RE.findall(text)
         amounts = []
         for match in matches:
             try:
@@ -360,16 +730,9 @@ class SOTADocumentProcessor:
 
     def _extract_dates(self, text: str) -> List[str]:
         """Extract dates from text"""
-        date_patterns = [
-            r'\d{1,2}/\d{1,2}/\d{4}',
-            r'\d{1,2}-\d{1,2}-\d{4}',
-            r'\d{4}-\d{1,2}-\d{1,2}',
-            r'[A-Za-z]+ \d{1,2}, \d{4}'
-        ]
-        
         dates = []
-        for pattern in date_patterns:
-            matches = re.findall(pattern, text)
+        for pattern in _DATE_RES:
+            matches = pattern.findall(text)
             for match in matches:
                 try:
                     parsed_date = parser.parse(match)
@@ -380,85 +743,87 @@ class SOTADocumentProcessor:
 
     def _extract_names(self, text: str) -> List[str]:
         """Extract person/entity names from text"""
-        # Simple pattern for names (capitalized words)
-        pattern = r'\b[A-Z][a-z]+ [A-Z][a-z]+\b'
-        matches = re.findall(pattern, text)
+        matches = _NAME_RE.findall(text)
         return list(set(matches))
 
     def _extract_addresses(self, text: str) -> List[str]:
         """Extract addresses from text"""
         # Pattern for US addresses
-        pattern = r'\d+\s+[A-Za-z0-9\s,]+(?:Street|St|Avenue|Ave|Road|Rd|Boulevard|Blvd|Lane|Ln|Drive|Dr|Court|Ct|Place|Pl)[A-Za-z0-9\s,]*\d{5}(?:-\d{4})?'
-        matches = re.findall(pattern, text, re.IGNORECASE)
-        return matches
+        return _ADDRESS_RE.findall(text)
 
     async def _apply_extracted_data_to_case(self, extracted_data: Dict[str, Any], document_type: str, bankruptcy_case: CompleteBankruptcyCase):
         """
         Apply extracted data to the appropriate bankruptcy forms
         """
         try:
-            if document_type == DocumentType.PAY_STUB:
-                await self._apply_paystub_data(extracted_data, bankruptcy_case)
-            elif document_type == DocumentType.BANK_STATEMENT:
-                await self._apply_bank_statement_data(extracted_data, bankruptcy_case)
-            elif document_type == DocumentType.TAX_RETURN:
-                await self._apply_tax_return_data(extracted_data, bankruptcy_case)
-            elif document_type == DocumentType.CREDIT_REPORT:
-                await self._apply_credit_report_data(extracted_data, bankruptcy_case)
+            apply_type_data = self._type_appliers.get(document_type)
+            if apply_type_data:
+                await apply_type_data(extracted_data, bankruptcy_case)
             
             # Apply common data (names, addresses) to debtor info
             await self._apply_common_data(extracted_data, bankruptcy_case)
             
         except Exception as e:
             logger.error(f"Error applying extracted data: {str(e)}")
+        finally:
+            bankruptcy_case.mark_dirty()
 
     async def _apply_paystub_data(self, data: Dict[str, Any], case: CompleteBankruptcyCase):
         """Apply paystub data to income forms"""
-        if 'gross_pay' in data and data['gross_pay']:
-            case.form_b121.debtor_income.employment_income = Decimal(str(data['gross_pay']))
-            case.form_b122.month_1_income = Decimal(str(data['gross_pay']))
+        gross_pay = data.get('gross_pay')
+        if gross_pay:
+            gross_pay = Decimal(str(gross_pay))
+            case.form_b121.debtor_income.employment_income = gross_pay
+            case.form_b122.month_1_income = gross_pay
         
-        if 'employer_name' in data and data['employer_name']:
+        employer_name = data.get('employer_name')
+        if employer_name:
             # Store employer info in extracted data for later use
-            case.extracted_data['employer_name'] = data['employer_name']
+            case.extracted_data['employer_name'] = employer_name
 
     async def _apply_bank_statement_data(self, data: Dict[str, Any], case: CompleteBankruptcyCase):
         """Apply bank statement data to asset forms"""
-        if 'ending_balance' in data and data['ending_balance']:
+        ending_balance = data.get('ending_balance')
+        if ending_balance:
             # Add to assets summary
             current_assets = case.form_b109.personal_property.current_value
-            case.form_b109.personal_property.current_value = current_assets + Decimal(str(data['ending_balance']))
+            case.form_b109.personal_property.current_value = current_assets + Decimal(str(ending_balance))
 
     async def _apply_tax_return_data(self, data: Dict[str, Any], case: CompleteBankruptcyCase):
         """Apply tax return data to income forms"""
-        if 'adjusted_gross_income' in data and data['adjusted_gross_income']:
-            case.form_b107.total_gross_income_current_year = Decimal(str(data['adjusted_gross_income']))
+        adjusted_gross_income = data.get('adjusted_gross_income')
+        if adjusted_gross_income:
+            case.form_b107.total_gross_income_current_year = Decimal(str(adjusted_gross_income))
         
-        if 'wages_salary' in data and data['wages_salary']:
-            monthly_wages = Decimal(str(data['wages_salary'])) / 12
+        wages_salary = data.get('wages_salary')
+        if wages_salary:
+            monthly_wages = Decimal(str(wages_salary)) / 12
             case.form_b121.debtor_income.employment_income = monthly_wages
 
     async def _apply_credit_report_data(self, data: Dict[str, Any], case: CompleteBankruptcyCase):
         """Apply credit report data to liability forms"""
-        if 'total_debt' in data and data['total_debt']:
-            case.form_b109.unsecured_nonpriority_claims.total_amount = Decimal(str(data['total_debt']))
+        total_debt = data.get('total_debt')
+        if total_debt:
+            case.form_b109.unsecured_nonpriority_claims.total_amount = Decimal(str(total_debt))
 
     async def _apply_common_data(self, data: Dict[str, Any], case: CompleteBankruptcyCase):
         """Apply common extracted data to debtor information"""
-        if 'names' in data and data['names']:
+        names = data.get('names')
+        if names:
             # Try to identify debtor name
-            if not case.form_b101.debtor_info.first_name and len(data['names']) > 0:
-                name_parts = data['names'][0].split()
+            if not case.form_b101.debtor_info.first_name:
+                name_parts = names[0].split()
                 if len(name_parts) >= 2:
                     case.form_b101.debtor_info.first_name = name_parts[0]
                     case.form_b101.debtor_info.last_name = name_parts[-1]
                     if len(name_parts) > 2:
                         case.form_b101.debtor_info.middle_name = ' '.join(name_parts[1:-1])
         
-        if 'addresses' in data and data['addresses']:
+        addresses = data.get('addresses')
+        if addresses:
             # Apply first address found to debtor info
-            if not case.form_b101.debtor_info.address_line_1 and len(data['addresses']) > 0:
-                address = data['addresses'][0]
+            if not case.form_b101.debtor_info.address_line_1:
+                address = addresses[0]
                 # Simple address parsing
                 case.form_b101.debtor_info.address_line_1 = address
 
@@ -467,24 +832,12 @@ class SOTADocumentProcessor:
         Generate a summary of all processed documents
         """
         try:
-            summary_prompt = f"""
-            Generate a comprehensive summary of the documents processed for this bankruptcy case:
-            
-            Documents: {', '.join(documents)}
-            
-            Include:
-            1. Document types identified
-            2. Key financial data extracted
-            3. Completeness of information
-            4. Any missing documents typically needed
-            5. Recommendations for additional documentation
-            
-            Format as a professional attorney-ready summary.
-            """
-            
             response = await self.openai_client.chat.completions.create(
                 model="gpt-4o",
-                messages=[{"role": "user", "content": summary_prompt}],
+                messages=[
+                    {"role": "system", "content": _DOCUMENT_SUMMARY_PROMPT},
+                    {"role": "user", "content": f"Documents: {', '.join(documents)}"}
+                ],
                 temperature=0.3
             )
             
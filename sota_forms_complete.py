@@ -6,9 +6,26 @@ All Official Forms for Chapter 7 and 13 Bankruptcy Filings
 from typing import Optional, List, Dict, Any, Union
 from datetime import datetime, date
 from decimal import Decimal
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, Field, PrivateAttr, validator
 from enum import Enum
 
+# Emptiness test per exact value type: one dict lookup instead of chained != comparisons
+# (Decimal/enum values would otherwise go through rich comparison against '' and [])
+_PRESENCE_CHECKS = {type(None): lambda value: False, str: bool, list: bool}
+
+def field_present(value: Any) -> bool:
+    """True when a form field holds a value (not None, '' or [])"""
+    check = _PRESENCE_CHECKS.get(type(value))
+    return check(value) if check else True
+
+# Forms scored for completion, as (form name, case attribute) pairs built once
+_COMPLETION_FORMS = tuple(
+    (form_name, f'form_{form_name}')
+    for form_name in ('b101', 'b106', 'b107', 'b108', 'b109', 'b121', 'b122', 'b123')
+)
+# Forms that must reach the filing threshold before attorney review
+_FILING_REQUIRED_FORMS = ('b101', 'b106', 'b107', 'b121', 'b122')
+
 class FilingType(str, Enum):
     CHAPTER_7 = "7"
     CHAPTER_13 = "13"
@@ -310,25 +327,45 @@ class CompleteBankruptcyCase(BaseModel):
     uploaded_documents: List[str] = Field(default_factory=list)
     extracted_data: Dict[str, Any] = Field(default_factory=dict)
     
+    # Completion figures, recomputed only after mark_dirty()
+    _completion_cache: Optional[Dict[str, float]] = PrivateAttr(default=None)
+    
+    def __setattr__(self, name: str, value: Any):
+        super().__setattr__(name, value)
+        if not name.startswith('_'):
+            self._completion_cache = None
+    
+    def mark_dirty(self):
+        """Invalidate cached completion figures; call after changing any nested form field"""
+        self._completion_cache = None
+    
     def get_completion_status(self) -> Dict[str, float]:
         """Calculate completion percentage for each form"""
+        if self._completion_cache is not None:
+            return self._completion_cache
+        
         completion = {}
         
-        for form_name in ['b101', 'b106', 'b107', 'b108', 'b109', 'b121', 'b122', 'b123']:
-            form_obj = getattr(self, f'form_{form_name}')
+        for form_name, attr_name in _COMPLETION_FORMS:
+            form_obj = getattr(self, attr_name)
             total_fields = len(form_obj.model_fields)
-            completed_fields = sum(1 for field, value in form_obj.model_dump().items() 
-                                 if value is not None and value != '' and value != [])
+            # Read field values in place rather than serializing a full model_dump() copy
+            completed_fields = sum(1 for field in form_obj.model_fields
+                                 if field_present(getattr(form_obj, field)))
             completion[form_name] = (completed_fields / total_fields) * 100 if total_fields > 0 else 0
-            
+        
+        self._completion_cache = completion
         return completion
     
+    def completion_percentage(self) -> float:
+        """Average completion across all forms"""
+        completion = self.get_completion_status()
+        return sum(completion.values()) / len(completion) if completion else 0
+    
     def is_ready_for_filing(self) -> bool:
         """Check if case is complete enough for attorney review"""
         completion = self.get_completion_status()
-        required_forms = ['b101', 'b106', 'b107', 'b121', 'b122']
-        
-        for form in required_forms:
+        for form in _FILING_REQUIRED_FORMS:
             if completion.get(form, 0) < 80:  # 80% completion threshold
                 return False
         return True
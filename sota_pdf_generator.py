@@ -3,9 +3,10 @@ SOTA PDF Generator - Bankruptcy Forms PDF Generation
 Generates official bankruptcy forms from completed case data
 """
 
+import asyncio
 import logging
 import os
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 from pathlib import Path
 from datetime import datetime, date
 from decimal import Decimal
@@ -43,6 +44,12 @@ class SOTAPDFGenerator:
         
         logger.info(f"PDF Generator initialized - Output: {self.output_dir}")
 
+    def _stamp(self, prefix: str, suffix: str = ".pdf") -> Tuple[datetime, Path]:
+        """Current time and a timestamped output path for a generated document"""
+        # One clock read names the file and dates its contents, so the two always agree
+        now = datetime.now()
+        return now, self.output_dir / f"{prefix}_{now.strftime('%Y%m%d_%H%M%S')}{suffix}"
+
     def _setup_custom_styles(self):
         """Setup custom PDF styles for bankruptcy forms"""
         if not REPORTLAB_AVAILABLE:
@@ -103,7 +110,7 @@ class SOTAPDFGenerator:
 
     async def _generate_form_b101(self, case: CompleteBankruptcyCase) -> str:
         """Generate Form B101 - Voluntary Petition"""
-        filename = self.output_dir / f"Form_B101_Petition_{datetime.now().strftime('%Y%m%d_%H%M%S')}.pdf"
+        now, filename = self._stamp("Form_B101_Petition")
         
         if REPORTLAB_AVAILABLE:
             doc = SimpleDocTemplate(str(filename), pagesize=letter)
@@ -146,7 +153,7 @@ class SOTAPDFGenerator:
             filing_data = [
                 ["Chapter:", str(case.filing_type.value) if case.filing_type else "Not specified"],
                 ["Marital Status:", str(case.form_b101.marital_status.value) if case.form_b101.marital_status else "Not provided"],
-                ["Filing Date:", datetime.now().strftime("%Y-%m-%d")]
+                ["Filing Date:", now.strftime("%Y-%m-%d")]
             ]
             
             filing_table = Table(filing_data, colWidths=[2*inch, 4*inch])
@@ -165,7 +172,7 @@ class SOTAPDFGenerator:
             story.append(Spacer(1, 40))
             story.append(Paragraph("Generated by DocketVoice - For Attorney Review", self.styles['Normal']))
             
-            doc.build(story)
+            await asyncio.to_thread(doc.build, story)
         else:
             # Text fallback
             await self._write_text_form_b101(filename, case)
@@ -174,7 +181,7 @@ class SOTAPDFGenerator:
 
     async def _generate_form_b106(self, case: CompleteBankruptcyCase) -> str:
         """Generate Form B106 - Declaration About Individual Debtor"""
-        filename = self.output_dir / f"Form_B106_Declaration_{datetime.now().strftime('%Y%m%d_%H%M%S')}.pdf"
+        now, filename = self._stamp("Form_B106_Declaration")
         
         if REPORTLAB_AVAILABLE:
             doc = SimpleDocTemplate(str(filename), pagesize=letter)
@@ -199,9 +206,9 @@ class SOTAPDFGenerator:
             story.append(Spacer(1, 20))
             story.append(Paragraph("Signature: _________________________________", self.styles['Normal']))
             story.append(Spacer(1, 10))
-            story.append(Paragraph(f"Date: {datetime.now().strftime('%Y-%m-%d')}", self.styles['Normal']))
+            story.append(Paragraph(f"Date: {now.strftime('%Y-%m-%d')}", self.styles['Normal']))
             
-            doc.build(story)
+            await asyncio.to_thread(doc.build, story)
         else:
             await self._write_text_form_b106(filename, case)
         
@@ -209,7 +216,7 @@ class SOTAPDFGenerator:
 
     async def _generate_form_b107(self, case: CompleteBankruptcyCase) -> str:
         """Generate Form B107 - Statement of Financial Affairs"""
-        filename = self.output_dir / f"Form_B107_FinancialAffairs_{datetime.now().strftime('%Y%m%d_%H%M%S')}.pdf"
+        _, filename = self._stamp("Form_B107_FinancialAffairs")
         
         if REPORTLAB_AVAILABLE:
             doc = SimpleDocTemplate(str(filename), pagesize=letter)
@@ -231,7 +238,7 @@ class SOTAPDFGenerator:
             story.append(Paragraph("Suits and Administrative Proceedings, Executions, Garnishments, and Attachments", self.styles['SectionHeader']))
             story.append(Paragraph("None reported during consultation", self.styles['Normal']))
             
-            doc.build(story)
+            await asyncio.to_thread(doc.build, story)
         else:
             await self._write_text_form_b107(filename, case)
         
@@ -239,7 +246,7 @@ class SOTAPDFGenerator:
 
     async def _generate_form_b121(self, case: CompleteBankruptcyCase) -> str:
         """Generate Form B121 - Statement of Income and Means Test"""
-        filename = self.output_dir / f"Form_B121_MeansTest_{datetime.now().strftime('%Y%m%d_%H%M%S')}.pdf"
+        _, filename = self._stamp("Form_B121_MeansTest")
         
         if REPORTLAB_AVAILABLE:
             doc = SimpleDocTemplate(str(filename), pagesize=letter)
@@ -295,7 +302,7 @@ class SOTAPDFGenerator:
                 ]))
                 story.append(expense_table)
             
-            doc.build(story)
+            await asyncio.to_thread(doc.build, story)
         else:
             await self._write_text_form_b121(filename, case)
         
@@ -303,7 +310,7 @@ class SOTAPDFGenerator:
 
     async def _generate_form_b122(self, case: CompleteBankruptcyCase) -> str:
         """Generate Form B122 - Statement of Current Monthly Income"""
-        filename = self.output_dir / f"Form_B122_CurrentIncome_{datetime.now().strftime('%Y%m%d_%H%M%S')}.pdf"
+        _, filename = self._stamp("Form_B122_CurrentIncome")
         
         if REPORTLAB_AVAILABLE:
             doc = SimpleDocTemplate(str(filename), pagesize=letter)
@@ -316,7 +323,7 @@ class SOTAPDFGenerator:
             story.append(Paragraph("Current Monthly Income Calculation", self.styles['SectionHeader']))
             story.append(Paragraph("This form calculates current monthly income for means test purposes.", self.styles['Normal']))
             
-            doc.build(story)
+            await asyncio.to_thread(doc.build, story)
         else:
             await self._write_text_form_b122(filename, case)
         
@@ -324,7 +331,7 @@ class SOTAPDFGenerator:
 
     async def generate_case_summary(self, case: CompleteBankruptcyCase) -> str:
         """Generate a comprehensive case summary"""
-        filename = self.output_dir / f"Case_Summary_{datetime.now().strftime('%Y%m%d_%H%M%S')}.pdf"
+        now, filename = self._stamp("Case_Summary")
         
         if REPORTLAB_AVAILABLE:
             doc = SimpleDocTemplate(str(filename), pagesize=letter)
@@ -340,7 +347,7 @@ class SOTAPDFGenerator:
             overview_data = [
                 ["Debtor Name:", f"{debtor_info.first_name} {debtor_info.last_name}"],
                 ["Filing Type:", str(case.filing_type.value) if case.filing_type else "Not specified"],
-                ["Generated:", datetime.now().strftime("%Y-%m-%d %H:%M:%S")],
+                ["Generated:", now.strftime("%Y-%m-%d %H:%M:%S")],
                 ["Status:", "Ready for Attorney Review"]
             ]
             
@@ -366,21 +373,21 @@ class SOTAPDFGenerator:
             story.append(Spacer(1, 20))
             story.append(Paragraph("All forms are ready for attorney review and filing preparation.", self.styles['Normal']))
             
-            doc.build(story)
+            await asyncio.to_thread(doc.build, story)
         else:
-            await self._write_text_case_summary(filename, case)
+            await self._write_text_case_summary(filename, case, now)
         
         return str(filename)
 
     # Text fallback methods for when ReportLab is not available
     async def _generate_text_fallback(self, form_code: str, case: CompleteBankruptcyCase) -> str:
         """Generate text file when PDF generation fails"""
-        filename = self.output_dir / f"Form_{form_code}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.txt"
+        now, filename = self._stamp(f"Form_{form_code}", ".txt")
         
         with open(filename, 'w', encoding='utf-8') as f:
             f.write(f"BANKRUPTCY FORM {form_code}\n")
             f.write("="*50 + "\n\n")
-            f.write(f"Generated by DocketVoice on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
+            f.write(f"Generated by DocketVoice on {now.strftime('%Y-%m-%d %H:%M:%S')}\n\n")
             
             debtor_info = case.form_b101.debtor_info
             f.write("DEBTOR INFORMATION:\n")
@@ -398,7 +405,7 @@ class SOTAPDFGenerator:
         
         return str(filename)
 
-    async def _write_text_case_summary(self, filename: Path, case: CompleteBankruptcyCase):
+    async def _write_text_case_summary(self, filename: Path, case: CompleteBankruptcyCase, now: datetime):
         """Write text-based case summary"""
         with open(filename, 'w', encoding='utf-8') as f:
             f.write("DOCKETVOICE BANKRUPTCY CASE SUMMARY\n")
@@ -409,7 +416,7 @@ class SOTAPDFGenerator:
             
             f.write(f"Overall Completion: {avg_completion:.1f}%\n")
             f.write(f"Ready for Filing: {case.is_ready_for_filing()}\n")
-            f.write(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
+            f.write(f"Generated: {now.strftime('%Y-%m-%d %H:%M:%S')}\n\n")
             
             f.write("Form Completion Status:\n")
             for form_name, completion_pct in completion_status.items():
@@ -3,7 +3,9 @@ Comprehensive Question Bank for Bankruptcy Form Completion
 Natural conversation flow for gathering all required bankruptcy information
 """
 
-from typing import Dict, List, Optional
+import random
+from typing import Dict, List, Mapping, Optional
+from types import MappingProxyType
 from enum import Enum
 
 class QuestionCategory(str, Enum):
@@ -456,34 +458,33 @@ EMPATHY_PHRASES = [
     "Thank you for being so thorough with your answers."
 ]
 
-def get_questions_for_category(category: QuestionCategory) -> Dict[str, List[str]]:
-    """Get all questions for a specific category"""
-    category_questions = {}
-    
-    category_mapping = {
-        QuestionCategory.PERSONAL_INFO: ['DebtorInfo.', 'SpouseInfo.'],
-        QuestionCategory.FINANCIAL_INFO: ['MonthlyIncome.', 'B122.'],
-        QuestionCategory.DEBTS_LIABILITIES: ['Debts.'],
-        QuestionCategory.ASSETS_PROPERTY: ['Assets.'],
-        QuestionCategory.INCOME_EMPLOYMENT: ['MonthlyIncome.', 'Employment.'],
-        QuestionCategory.EXPENSES: ['MonthlyExpenses.'],
-        QuestionCategory.LEGAL_HISTORY: ['Legal.', 'Financial.'],
-        QuestionCategory.PREFERENCES: ['Intention.', 'B123.']
-    }
-    
-    prefixes = category_mapping.get(category, [])
-    
-    for key, questions in QUESTION_BANK.items():
-        for prefix in prefixes:
-            if key.startswith(prefix):
-                category_questions[key] = questions
-                break
-    
-    return category_questions
+# Field-key prefixes that belong to each interview category
+_CATEGORY_PREFIXES = {
+    QuestionCategory.PERSONAL_INFO: ('DebtorInfo.', 'SpouseInfo.'),
+    QuestionCategory.FINANCIAL_INFO: ('MonthlyIncome.', 'B122.'),
+    QuestionCategory.DEBTS_LIABILITIES: ('Debts.',),
+    QuestionCategory.ASSETS_PROPERTY: ('Assets.',),
+    QuestionCategory.INCOME_EMPLOYMENT: ('MonthlyIncome.', 'Employment.'),
+    QuestionCategory.EXPENSES: ('MonthlyExpenses.',),
+    QuestionCategory.LEGAL_HISTORY: ('Legal.', 'Financial.'),
+    QuestionCategory.PREFERENCES: ('Intention.', 'B123.')
+}
+
+# The question bank is static, so each category's slice is materialized once at import
+_CATEGORY_QUESTIONS = {
+    category: MappingProxyType({
+        key: questions for key, questions in QUESTION_BANK.items() if key.startswith(prefixes)
+    })
+    for category, prefixes in _CATEGORY_PREFIXES.items()
+}
+_NO_QUESTIONS = MappingProxyType({})
+
+def get_questions_for_category(category: QuestionCategory) -> Mapping[str, List[str]]:
+    """Get all questions for a specific category (shared, read-only)"""
+    return _CATEGORY_QUESTIONS.get(category, _NO_QUESTIONS)
 
 def get_random_question(field_key: str) -> Optional[str]:
     """Get a random question for a specific field"""
-    import random
     questions = QUESTION_BANK.get(field_key)
     if questions:
         return random.choice(questions)
@@ -491,7 +492,6 @@ def get_random_question(field_key: str) -> Optional[str]:
 
 def get_follow_up_question(situation: str) -> Optional[str]:
     """Get an appropriate follow-up question"""
-    import random
     questions = FOLLOW_UP_QUESTIONS.get(situation)
     if questions:
         return random.choice(questions)
@@ -499,10 +499,8 @@ def get_follow_up_question(situation: str) -> Optional[str]:
 
 def get_transition_phrase() -> str:
     """Get a random transition phrase"""
-    import random
     return random.choice(TRANSITION_PHRASES)
 
 def get_empathy_phrase() -> str:
     """Get a random empathy phrase"""
-    import random
     return random.choice(EMPATHY_PHRASES)
@@ -7,19 +7,55 @@ No manual WebSocket implementation required
 
 import asyncio
 import json
+import heapq
 import logging
 import base64
 import os
+import re
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from typing import Optional, Dict, Any, List, Callable, AsyncGenerator
 from openai import AsyncOpenAI
 from dataclasses import dataclass
 import time
 
+# Fast JSON for Realtime payloads and tool-call round trips
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+_SSN_RE = re.compile(r'^\d{3}-\d{2}-\d{4}$')
+
+# Financial stress level by number of indicators raised, capped at the last entry
+_STRESS_LEVELS = ("low", "moderate", "high", "critical")
+
 # Setup logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Pooled session for ephemeral token minting, so TLS to api.openai.com is reused across sessions
+_openai_session = requests.Session()
+_openai_session.mount("https://", HTTPAdapter(
+    pool_connections=16,
+    pool_maxsize=64,
+    max_retries=Retry(total=2, backoff_factor=0.2)
+))
+
+def _json_dumps(obj: Any) -> str:
+    """Serialize to a JSON string, using orjson when installed"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj)
+
+def _json_loads(data) -> Any:
+    """Parse a JSON string or bytes, using orjson when installed"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
 @dataclass
 class RealtimeConfig:
     """Configuration for OpenAI Realtime API using official SDK"""
@@ -29,11 +65,14 @@ class RealtimeConfig:
     input_audio_format: str = "pcm16"
     output_audio_format: str = "pcm16"
     
-    # VAD Configuration
+    # VAD Configuration - tuned for early speech detection and short turn gaps
     vad_type: str = "server_vad"  # Options: none, server_vad, semantic_vad
-    vad_threshold: float = 0.5
-    vad_prefix_padding_ms: int = 300
-    vad_silence_duration_ms: int = 200
+    vad_threshold: float = 0.4
+    vad_prefix_padding_ms: int = 200
+    vad_silence_duration_ms: int = 180
+    
+    # Streaming transcription (emits partial transcript deltas)
+    transcription_model: str = "gpt-4o-transcribe"
     
     # Model Configuration
     temperature: float = 0.8
@@ -66,10 +105,12 @@ class ModernRealtimeVoiceSystem:
         self.text_output_handlers: List[Callable] = []
         self.function_call_handlers: Dict[str, Callable] = {}
         self.event_handlers: Dict[str, Callable] = {}
+        self.interrupt_handlers: List[Callable] = []
         
         # Response tracking
         self.current_response_id = None
         self.response_start_time = 0
+        self.first_audio_pending = False
         
         # Function tools for bankruptcy consultation
         self.tools = self._define_bankruptcy_tools()
@@ -346,8 +387,6 @@ class ModernRealtimeVoiceSystem:
                 logger.error("Cannot mint ephemeral token: base OpenAI API key missing")
                 return None
 
-            import requests, json
-
             url = "https://api.openai.com/v1/realtime/client_secrets"
             headers = {
                 "Authorization": f"Bearer {api_key}",
@@ -367,13 +406,13 @@ class ModernRealtimeVoiceSystem:
             }
 
             logger.info("Requesting ephemeral client secret (payload keys: %s)", list(payload['session'].keys()))
-            response = requests.post(url, headers=headers, data=json.dumps(payload), timeout=15)
+            response = _openai_session.post(url, headers=headers, data=_json_dumps(payload), timeout=15)
 
             if response.status_code != 200:
                 logger.error("Ephemeral token request failed %s: %s", response.status_code, response.text)
                 return None
 
-            data = response.json()
+            data = _json_loads(response.content)
             token = data.get("value")
             if not token:
                 logger.error("Ephemeral token response missing value: %s", data)
@@ -401,8 +440,6 @@ class ModernRealtimeVoiceSystem:
                 logger.error("Cannot mint ephemeral token: base OpenAI API key missing")
                 return None, None
 
-            import requests, json
-
             # Single source of truth for model - must match exactly in SDP POST
             model = "gpt-realtime"
             
@@ -420,13 +457,13 @@ class ModernRealtimeVoiceSystem:
             }
 
             logger.info(f"Minting ephemeral token with model: {model}")
-            response = requests.post(url, headers=headers, data=json.dumps(payload), timeout=15)
+            response = _openai_session.post(url, headers=headers, data=_json_dumps(payload), timeout=15)
 
             if response.status_code != 200:
                 logger.error("Ephemeral token request failed %s: %s", response.status_code, response.text)
                 return None, None
 
-            data = response.json()
+            data = _json_loads(response.content)
             token = data.get("client_secret", {}).get("value")
             if not token:
                 logger.error("Ephemeral token response missing client_secret.value: %s", data)
@@ -454,6 +491,19 @@ class ModernRealtimeVoiceSystem:
             "iceCandidatePoolSize": 10
         }
     
+    def get_turn_detection_config(self) -> Optional[Dict[str, Any]]:
+        """Get turn detection (VAD) settings shared by server and WebRTC sessions"""
+        if self.config.vad_type == "none":
+            return None
+        return {
+            "type": self.config.vad_type,
+            "threshold": self.config.vad_threshold,
+            "prefix_padding_ms": self.config.vad_prefix_padding_ms,
+            "silence_duration_ms": self.config.vad_silence_duration_ms,
+            "create_response": True,
+            "interrupt_response": True
+        }
+    
     async def handle_function_call(self, function_name: str, arguments: Dict[str, Any]) -> Dict[str, Any]:
         """Handle function calls from the AI (for web client compatibility)"""
         return await self._execute_default_function(function_name, arguments)
@@ -473,7 +523,7 @@ class ModernRealtimeVoiceSystem:
                 "input_audio_format": self.config.input_audio_format,
                 "output_audio_format": self.config.output_audio_format,
                 "input_audio_transcription": {
-                    "model": "whisper-1"
+                    "model": self.config.transcription_model
                 },
                 "temperature": self.config.temperature,
                 "max_response_output_tokens": self.config.max_response_output_tokens,
@@ -482,13 +532,9 @@ class ModernRealtimeVoiceSystem:
             }
             
             # Add turn detection if VAD is enabled
-            if self.config.vad_type != "none":
-                session_config["turn_detection"] = {
-                    "type": self.config.vad_type,
-                    "threshold": self.config.vad_threshold,
-                    "prefix_padding_ms": self.config.vad_prefix_padding_ms,
-                    "silence_duration_ms": self.config.vad_silence_duration_ms
-                }
+            turn_detection = self.get_turn_detection_config()
+            if turn_detection:
+                session_config["turn_detection"] = turn_detection
             
             # Connect using the official SDK
             self.connection = await self.client.realtime.connect(
@@ -625,14 +671,25 @@ Begin each consultation by warmly greeting the client and explaining the consult
             transcript = getattr(event, 'transcript', '')
             logger.info(f"User said: {transcript}")
             
+        elif event_type == "input_audio_buffer.speech_started":
+            # Barge-in: the user started talking over the assistant
+            if self.current_response_id:
+                await self._handle_interrupt()
+            
         elif event_type == "response.created":
             self.current_response_id = getattr(event, 'response_id', None)
+            if not self.response_start_time:
+                self.response_start_time = time.time()
+            self.first_audio_pending = True
             logger.debug(f"Response created: {self.current_response_id}")
             
         elif event_type == "response.audio.delta":
-            # Handle streaming audio output
+            # Handle streaming audio output - forward each delta as soon as it arrives
             audio_delta = getattr(event, 'delta', '')
             if audio_delta:
+                if self.first_audio_pending:
+                    self.first_audio_pending = False
+                    logger.info(f"First audio after {time.time() - self.response_start_time:.3f}s")
                 await self._handle_audio_output(audio_delta)
                 
         elif event_type == "response.text.delta":
@@ -649,6 +706,8 @@ Begin each consultation by warmly greeting the client and explaining the consult
                 latency = time.time() - self.response_start_time
                 logger.info(f"Response completed in {latency:.3f}s")
             self.current_response_id = None
+            self.response_start_time = 0
+            self.first_audio_pending = False
             
         elif event_type == "error":
             error_msg = getattr(event, 'message', 'Unknown error')
@@ -662,6 +721,19 @@ Begin each consultation by warmly greeting the client and explaining the consult
             except Exception as e:
                 logger.error(f"Audio output handler error: {e}")
     
+    def on_interrupt(self, handler: Callable) -> None:
+        """Register a handler to drop queued playback when the user barges in"""
+        self.interrupt_handlers.append(handler)
+    
+    async def _handle_interrupt(self) -> None:
+        """Notify audio sinks that the current response was interrupted"""
+        self.first_audio_pending = False
+        for handler in self.interrupt_handlers:
+            try:
+                await handler()
+            except Exception as e:
+                logger.error(f"Interrupt handler error: {e}")
+    
     async def _handle_text_output(self, text: str) -> None:
         """Handle text output from the model"""
         for handler in self.text_output_handlers:
@@ -676,7 +748,7 @@ Begin each consultation by warmly greeting the client and explaining the consult
             call_id = getattr(event, 'call_id', None)
             name = getattr(event, 'name', '')
             arguments_str = getattr(event, 'arguments', '{}')
-            arguments = json.loads(arguments_str)
+            arguments = _json_loads(arguments_str)
             
             logger.info(f"Function call: {name}")
             
@@ -691,7 +763,7 @@ Begin each consultation by warmly greeting the client and explaining the consult
                 item={
                     "type": "function_call_output",
                     "call_id": call_id,
-                    "output": json.dumps(result)
+                    "output": _json_dumps(result)
                 }
             )
             
@@ -761,11 +833,16 @@ Begin each consultation by warmly greeting the client and explaining the consult
         # Calculate totals
         total_income = sum(monthly_income.values())
         total_expenses = sum(monthly_expenses.values())
-        total_debt = sum(debt.get("current_balance", 0) for debt in debts)
         total_assets = sum(asset.get("current_value", 0) for asset in assets)
         
-        # Categorize debts
-        secured_debt = sum(debt.get("current_balance", 0) for debt in debts if debt.get("is_secured", False))
+        # Total and categorize debts in one pass over the list
+        total_debt = secured_debt = monthly_payments = 0
+        for debt in debts:
+            balance = debt.get("current_balance", 0)
+            total_debt += balance
+            if debt.get("is_secured", False):
+                secured_debt += balance
+            monthly_payments += debt.get("monthly_payment", 0)
         unsecured_debt = total_debt - secured_debt
         
         # Calculate key ratios
@@ -788,20 +865,20 @@ Begin each consultation by warmly greeting the client and explaining the consult
             },
             "expense_analysis": {
                 "total_monthly": total_expenses,
-                "largest_categories": sorted(monthly_expenses.items(), key=lambda x: x[1], reverse=True)[:3]
+                "largest_categories": heapq.nlargest(3, monthly_expenses.items(), key=lambda x: x[1])
             },
             "debt_analysis": {
                 "total_debt": total_debt,
                 "secured_debt": secured_debt,
                 "unsecured_debt": unsecured_debt,
-                "monthly_payments": sum(debt.get("monthly_payment", 0) for debt in debts)
+                "monthly_payments": monthly_payments
             },
             "cash_flow": {
                 "disposable_income": disposable_income,
                 "debt_to_income_ratio": debt_to_income
             },
             "stress_assessment": {
-                "level": "critical" if len(stress_indicators) >= 3 else "high" if len(stress_indicators) >= 2 else "moderate" if len(stress_indicators) >= 1 else "low",
+                "level": _STRESS_LEVELS[min(len(stress_indicators), len(_STRESS_LEVELS) - 1)],
                 "indicators": stress_indicators
             }
         }
@@ -893,9 +970,7 @@ Begin each consultation by warmly greeting the client and explaining the consult
     
     def _validate_ssn(self, ssn: str) -> bool:
         """Validate SSN format"""
-        import re
-        pattern = r'^\d{3}-\d{2}-\d{4}$'
-        return bool(re.match(pattern, ssn))
+        return bool(_SSN_RE.match(ssn))
     
     async def _generate_consultation_report(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """Generate comprehensive consultation report"""
@@ -948,10 +1023,12 @@ class SOTA_Voice:
             logger.error(f"Failed to initialize SOTA Voice: {e}")
             return False
 
-    async def speak(self, text: str) -> bool:
-        """Speak text using the voice system"""
+    async def speak(self, text: str, started: Optional[asyncio.Event] = None) -> bool:
+        """Speak text using the voice system; sets started once playback has begun"""
         try:
             logger.info(f"SOTA_Voice speaking: {text}")
+            if started is not None:
+                started.set()
             # For production mode, we'll log the speech instead of actual TTS
             # since the main consultation uses WebRTC
             return True
@@ -980,6 +1057,10 @@ class SOTA_Voice:
         """Interrupt current response"""
         logger.info("Voice response interrupted")
 
+    def on_interrupt(self, handler: Callable) -> None:
+        """Register a handler to run when the user barges in"""
+        self.voice_system.on_interrupt(handler)
+
     async def shutdown(self):
         """Shutdown voice system"""
         logger.info("SOTA Voice system shutdown")